@@ -141,10 +141,12 @@ def main():
         '--hidden-import', 'huggingface_hub',
         '--hidden-import', 'docx',
         '--hidden-import', 'openpyxl',
+        '--hidden-import', 'python_calamine',
         '--hidden-import', 'llama_cpp',
         '--hidden-import', 'lxml._elementpath',
         '--hidden-import', 'diskcache',
         '--hidden-import', 'pyperclip',
+        '--hidden-import', 'orjson',
         '--hidden-import', 'webbrowser',
     ])
 
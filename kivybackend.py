@@ -18,18 +18,33 @@ import sys
 import threading
 import time
 import traceback
-from datetime import datetime
-from typing import Callable, List, Sequence
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, List, Sequence
 
-import pandas as pd
 from docx import Document
 from docx.shared import Inches, Pt
-from llama_cpp import Llama
+
+if TYPE_CHECKING:
+    # pandas and llama_cpp are imported where they are used so that importing
+    # the backend (and starting the GUI) does not pay for them up front.
+    # llama_cpp loads its native library on import, which is the slower one.
+    import pandas as pd
+    from llama_cpp import Llama
 
 # Model to download
 MODEL_REPO = "unsloth/Qwen3-4B-Instruct-2507-GGUF"
 MODEL_FILENAME = "Qwen3-4B-Instruct-2507-Q4_1.gguf"
 
+# The model file is fetched as this many parallel HTTP Range requests
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+# How long (seconds) a models-folder listing is reused before rescanning
+MODELS_LIST_TTL = 2.0
+
+# Bracketed notes like "[staff only]", stripped when ignore_brackets is on
+_BRACKET_RE = re.compile(r'\[.*?\]')
+
 # resource module is Unix-specific, so we remove it for Windows compatibility.
 resource = None
 
@@ -246,12 +261,16 @@ Report:
 class AgendaBackend:
     @staticmethod
     def get_display_date(date_value):
-        if isinstance(date_value, (datetime, pd.Timestamp)):
-            if pd.isna(date_value):
+        # Called once per cell via Series.map, so it stays free of imports.
+        # pd.Timestamp and pd.NaT are datetime subclasses; NaT is the only
+        # one that does not compare equal to itself.
+        if isinstance(date_value, str):
+            return date_value.strip()
+        if isinstance(date_value, datetime):
+            if date_value != date_value:
                 return ""
             return date_value.strftime("%d-%b")
-        else:
-            return str(date_value).strip()
+        return str(date_value).strip()
     """
     All heavy-lifting lives here.  GUI / CLI frontends interface only via
     the public methods of this class.
@@ -261,6 +280,8 @@ class AgendaBackend:
         self.user_data_dir = user_data_dir
         self.model_path = model_path
         self.llm_model: Llama | None = None
+        # (monotonic time, filenames) of the last models folder scan
+        self._models_cache: tuple[float, List[str]] | None = None
 
     # ----------------------------  Multi-Model helpers  ----------------------------
     def _get_models_dir(self) -> str:
@@ -271,13 +292,26 @@ class AgendaBackend:
         os.makedirs(models_dir, exist_ok=True)
         return models_dir
 
-    def get_available_models(self) -> List[str]:
-        """List *.gguf files (filenames only) available in the models directory."""
+    def get_available_models(self, refresh: bool = False) -> List[str]:
+        """List *.gguf files (filenames only) available in the models directory.
+
+        The listing is cached for MODELS_LIST_TTL seconds since the UI asks
+        for it several times per update; pass refresh=True to rescan now.
+        """
+        now = time.monotonic()
+        if not refresh and self._models_cache is not None and now - self._models_cache[0] < MODELS_LIST_TTL:
+            return list(self._models_cache[1])
         try:
             models_dir = self._get_models_dir()
-            return sorted([f for f in os.listdir(models_dir) if f.lower().endswith(".gguf")])
+            models = sorted([f for f in os.listdir(models_dir) if f.lower().endswith(".gguf")])
         except Exception:
             return []
+        self._models_cache = (now, models)
+        return list(models)
+
+    def invalidate_models_cache(self):
+        """Forget the cached models listing (call after adding/removing files)."""
+        self._models_cache = None
 
     def load_model_by_filename(self, filename: str):
         """
@@ -301,20 +335,20 @@ class AgendaBackend:
             missing_str = ", ".join(f"'{h}'" for h in missing_headers)
             raise ValueError(f"The selected sheet is missing required columns: {missing_str}")
 
-    def process_spreadsheet_data(self, dataframe: pd.DataFrame, spreadsheet_headers: dict) -> tuple[pd.DataFrame, List[pd.Series]]:
-        """Validate headers and filter rows from a DataFrame → return (df, all_items)."""
+    def process_spreadsheet_data(self, dataframe: pd.DataFrame, spreadsheet_headers: dict) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Validate headers and filter rows from a DataFrame → return (df, agenda_rows_df)."""
         self._validate_headers(dataframe, list(spreadsheet_headers.values()))
 
-        # only keep rows where MEETING DATE starts with a digit - actual agenda items
-        all_items: List[pd.Series] = []
-        for _, row in dataframe.iterrows():
-            meeting_date = self.get_display_date(row.get(spreadsheet_headers["date"], ""))
-            if meeting_date and meeting_date[0].isdigit():
-                all_items.append(row)
+        # only keep rows where MEETING DATE starts with a digit - actual agenda items.
+        # The test runs as one vectorised string op over the column, and the
+        # matching rows stay a DataFrame so callers can pull whole columns.
+        display_dates = dataframe[spreadsheet_headers["date"]].map(self.get_display_date).astype(object)
+        is_item = display_dates.str[:1].str.isdigit().fillna(False).to_numpy(dtype=bool)
+        agenda_rows = dataframe[is_item]
 
-        if not all_items:
+        if agenda_rows.empty:
             raise RuntimeError("No valid agenda item rows found in the selected sheet.")
-        return dataframe, all_items
+        return dataframe, agenda_rows
 
     # ------------------------------------------------------------------ LLM loading
     def _load_llm_model_async(self, model_path: str | None = None):
@@ -329,6 +363,8 @@ class AgendaBackend:
                 if not path_to_load or not os.path.exists(path_to_load):
                     print(f"[backend] Model file not found: {path_to_load}")
                     return
+                from llama_cpp import Llama
+
                 with suppress_stderr():
                     self.llm_model = Llama(
                         model_path=path_to_load,
@@ -345,6 +381,83 @@ class AgendaBackend:
 
         threading.Thread(target=_loader, daemon=True).start()
 
+    def _download_model_file(self, models_dir: str) -> str:
+        """
+        Fetch MODEL_FILENAME into *models_dir* using DOWNLOAD_WORKERS parallel
+        HTTP Range requests, each writing its slice at the right file offset.
+        Returns the final path; raises if any part fails (caller falls back).
+        A file already in *models_dir* whose size and sha256 match the hub's
+        metadata is reused as is.
+        """
+        import hashlib
+        from concurrent.futures import ThreadPoolExecutor
+
+        from huggingface_hub import get_hf_file_metadata, hf_hub_url
+        from huggingface_hub.utils import get_session
+
+        # Resolves the CDN location and the exact size of the file
+        meta = get_hf_file_metadata(hf_hub_url(MODEL_REPO, MODEL_FILENAME))
+        size = meta.size
+        if not size:
+            raise ValueError("model size unknown, cannot split the download")
+
+        final_path = os.path.join(models_dir, MODEL_FILENAME)
+        # For LFS files (the model is one) the etag is the content's sha256
+        etag = (meta.etag or "").lower()
+        with contextlib.suppress(OSError):
+            if len(etag) == 64 and os.path.getsize(final_path) == size:
+                digest = hashlib.sha256()
+                with open(final_path, "rb") as fp:
+                    for chunk in iter(lambda: fp.read(DOWNLOAD_CHUNK_BYTES), b""):
+                        digest.update(chunk)
+                if digest.hexdigest() == etag:
+                    return final_path
+
+        part_path = final_path + ".part"
+        with open(part_path, "wb") as fp:
+            fp.truncate(size)
+
+        step = -(-size // DOWNLOAD_WORKERS)
+        ranges = [(lo, min(lo + step, size) - 1) for lo in range(0, size, step)]
+        stop = threading.Event()  # set when one range fails so the others bail out
+
+        def fetch(lo: int, hi: int):
+            headers = {"Range": f"bytes={lo}-{hi}"}
+            with get_session().get(meta.location, headers=headers, stream=True, timeout=60) as resp:
+                resp.raise_for_status()
+                if resp.status_code != 206:
+                    raise IOError("server does not support range requests")
+                written = 0
+                with open(part_path, "r+b") as fp:
+                    fp.seek(lo)
+                    for chunk in resp.iter_content(DOWNLOAD_CHUNK_BYTES):
+                        if stop.is_set():
+                            raise IOError("download aborted")
+                        fp.write(chunk)
+                        written += len(chunk)
+            if written != hi - lo + 1:
+                raise IOError(f"incomplete download of bytes {lo}-{hi}")
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(fetch, lo, hi) for lo, hi in ranges]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    # the pool's exit waits for every worker; stop them first
+                    stop.set()
+                    raise
+            # inside the try so a failed rename (e.g. the target held open on
+            # Windows) also removes the .part file
+            os.replace(part_path, final_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(part_path)
+            raise
+
+        return final_path
+
     def download_model(
         self,
         done_callback: Callable[[str], None] | None = None,
@@ -360,26 +473,46 @@ class AgendaBackend:
 
             print(f"[backend] Downloading model to: {models_dir}")
 
+            try:
+                downloaded_path = self._download_model_file(models_dir)
+            except Exception as e:
+                # Fall back to the hub's own (single stream) download below
+                print(f"[backend] Parallel download failed, retrying via the hub client: {e}")
+                downloaded_path = None
+
+            from llama_cpp import Llama
+
             # Suppress llama.cpp noise during download/load
             with suppress_stderr():
-                # Llama.from_pretrained downloads AND loads the model, returning an instance.
-                new_llm_instance = Llama.from_pretrained(
-                    repo_id=MODEL_REPO,
-                    filename=MODEL_FILENAME,
-                    local_dir=models_dir,
-                    local_dir_use_symlinks=False,  # Use False for better cross-platform/packaging support
-                    verbose=False,  # Set to False to avoid duplicate progress info
-                    # Add other loading params for consistency
-                    chat_format="chatml",
-                    n_ctx=10000,
-                    n_threads=default_threads(),
-                    n_gpu_layers=-1,
-                )
+                if downloaded_path:
+                    new_llm_instance = Llama(
+                        model_path=downloaded_path,
+                        verbose=False,
+                        chat_format="chatml",
+                        n_ctx=10000,
+                        n_threads=default_threads(),
+                        n_gpu_layers=-1,
+                    )
+                else:
+                    # Llama.from_pretrained downloads AND loads the model, returning an instance.
+                    new_llm_instance = Llama.from_pretrained(
+                        repo_id=MODEL_REPO,
+                        filename=MODEL_FILENAME,
+                        local_dir=models_dir,
+                        local_dir_use_symlinks=False,  # Use False for better cross-platform/packaging support
+                        verbose=False,  # Set to False to avoid duplicate progress info
+                        # Add other loading params for consistency
+                        chat_format="chatml",
+                        n_ctx=10000,
+                        n_threads=default_threads(),
+                        n_gpu_layers=-1,
+                    )
 
             final_model_path = new_llm_instance.model_path
             
             self.llm_model = new_llm_instance
             self.model_path = final_model_path
+            self.invalidate_models_cache()
 
             print(f"[backend] Model downloaded and loaded from: {final_model_path}")
             if done_callback:
@@ -393,7 +526,7 @@ class AgendaBackend:
     # ------------------------------------------------------------------ Public generation API
     def generate_report(
         self,
-        selected_rows: Sequence[pd.Series],
+        selected_rows: Sequence[dict],
         *,
         token_callback: Callable[[str], None] | None = None,
         done_callback: Callable[[str, List[str]], None] | None = None,
@@ -407,6 +540,8 @@ class AgendaBackend:
     ):
         """
         Two-pass streaming generation.
+        • selected_rows are spreadsheet rows as {column header: value} dicts
+          (a pandas Series works too).
         • token_callback receives GUI-safe text snippets.
         • done_callback(full_report_text, meeting_dates)
         Errors are forwarded to error_callback.
@@ -439,7 +574,7 @@ class AgendaBackend:
     # ------------------------------------------------------------------ Internal generation logic
     def _run_generation(
         self,
-        rows: List[pd.Series],
+        rows: List[dict],
         token_cb: Callable[[str], None] | None,
         done_cb: Callable[[str, List[str]], None] | None,
         err_cb: Callable[[Exception], None] | None,
@@ -462,12 +597,18 @@ class AgendaBackend:
                 "include": "Include in Summary for Mayor",
             }
 
+        # Resolve the header names once rather than per row
+        h_date = spreadsheet_headers["date"]
+        h_section = spreadsheet_headers["section"]
+        h_item = spreadsheet_headers["item"]
+        h_notes = spreadsheet_headers["notes"]
+
         try:
             # Group rows by date, preserving original order
-            grouped: dict[str, List[pd.Series]] = {}
+            grouped: dict[str, List[dict]] = {}
             ordered_dates: List[str] = []
             for r in rows:
-                date = self.get_display_date(r[spreadsheet_headers["date"]])
+                date = self.get_display_date(r[h_date])
                 if date not in grouped:
                     grouped[date] = []
                     ordered_dates.append(date)
@@ -483,27 +624,27 @@ class AgendaBackend:
                         print("\n[backend] Generation cancelled by user.")
                     return
                 items = grouped[md]
-                items.sort(key=lambda x: str(x.get(spreadsheet_headers["section"], "")))
+                items.sort(key=lambda x: str(x.get(h_section, "")))
 
                 # Build items text for summarisation pass
                 items_text = ""
                 for it in items:
                     # Pull section, 'placeholder' if none
-                    sec = str(it.get(spreadsheet_headers["section"], "N/A")).replace("\n", " ").replace("•", "-").strip()
+                    sec = str(it.get(h_section, "N/A")).replace("\n", " ").replace("•", "-").strip()
                     if sec == "nan" or sec == "":
                         sec = "placeholder"
                     # Pull title, 'unnamed item' if none
-                    title = str(it.get(spreadsheet_headers["item"], "N/A")).replace("\n", " ").replace("•", "-").strip()
+                    title = str(it.get(h_item, "N/A")).replace("\n", " ").replace("•", "-").strip()
                     if title == "nan" or title == "":
                         title = "unnamed item"
                     # Pull notes, does not get added at all to entry if none.
-                    notes_val = it.get(spreadsheet_headers["notes"])
+                    notes_val = it.get(h_notes)
                     notes = str(notes_val).replace("\n", " ").replace("•", "-").strip()
                     # If ignore brackets, strip from each item only, not across entries.
                     if ignore_brackets:
-                        sec = re.sub(r'\[.*?\]', '', sec)
-                        title = re.sub(r'\[.*?\]', '', title)
-                        notes = re.sub(r'\[.*?\]', '', notes)
+                        sec = _BRACKET_RE.sub('', sec)
+                        title = _BRACKET_RE.sub('', title)
+                        notes = _BRACKET_RE.sub('', notes)
                     entry = f"- Item: {title}, Section: \"{sec}\""
                     if (notes.lower() != "nan") and (notes != ""):  # Empty notes not included
                         entry += f", Notes: \"{notes}\""
@@ -759,7 +900,7 @@ class AgendaBackend:
         doc.add_paragraph()
         
         # Significant items section
-        last_report_date = (datetime.now() - pd.Timedelta(days=60)).strftime("%B")
+        last_report_date = (datetime.now() - timedelta(days=60)).strftime("%B")
         sig_items = doc.add_paragraph(f"Significant Items Completed Since {last_report_date} (2 months ago placeholder):")
         sig_items.runs[0].bold = True
         doc.add_paragraph("[Placeholder for user to manually enter items.]")
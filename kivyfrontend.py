@@ -17,11 +17,13 @@ CustomTkinter GUI while adding:
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
 # --- Clipboard crash workaround (Windows & fallback) -----------------------------------
 # Some Windows systems fail to initialise a clipboard provider, leaving
 # `kivy.core.clipboard.Clipboard` as `None`.  When Kivy's TextInput invokes
@@ -123,33 +125,67 @@ except Exception as e:
 import threading
 import traceback
 import webbrowser
-import re
+from collections import deque
 import time
 from datetime import datetime
-from typing import List, Callable
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, List, Callable
+
+# Config (de)serialisation: use orjson when installed, else the stdlib json.
+try:
+    import orjson
+
+    _conf_loads = orjson.loads
+
+    def _conf_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _conf_loads = json.loads
+
+    def _conf_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
-import pandas as pd
 from kivy import platform  # type: ignore
 from kivy.app import App
-from kivy.clock import mainthread
+from kivy.clock import Clock, mainthread
 from kivy.core.window import Window
 from kivy.core.audio import SoundLoader
 
-# More robust notification setup
-notification = None
-try:
-    # On macOS, plyer requires pyobjus. Check for it explicitly.
-    if platform == 'macosx':
-        import pyobjus  # This will raise ImportError if not installed
-    from plyer import notification
-except ImportError:
-    if platform == 'macosx':
-        print("Warning: 'pyobjus' or 'plyer' not found. System notifications on macOS will be disabled.", file=sys.stderr)
-        print("To enable them, run: pip install 'plyer[mac_os_notification]'", file=sys.stderr)
-    else:
-        print("Warning: 'plyer' not found. System notifications will be disabled.", file=sys.stderr)
-        print("To enable them, run: pip install plyer", file=sys.stderr)
+if TYPE_CHECKING:
+    # pandas/numpy are imported lazily where spreadsheets are read; they are
+    # only needed here for annotations.
+    import numpy as np
+    import pandas as pd
+
+# System notifications are set up lazily on first use (see _get_notifier), so
+# probing plyer/pyobjus does not slow down app start.
+_notifier = None
+_notifier_checked = False
+
+
+def _get_notifier():
+    """Return plyer's notification facade, or None if it is unavailable."""
+    global _notifier, _notifier_checked
+    if _notifier_checked:
+        return _notifier
+    _notifier_checked = True
+    try:
+        # On macOS, plyer requires pyobjus. Check for it explicitly.
+        if platform == 'macosx':
+            import pyobjus  # This will raise ImportError if not installed
+        from plyer import notification
+        _notifier = notification
+    except ImportError:
+        if platform == 'macosx':
+            print("Warning: 'pyobjus' or 'plyer' not found. System notifications on macOS will be disabled.", file=sys.stderr)
+            print("To enable them, run: pip install 'plyer[mac_os_notification]'", file=sys.stderr)
+        else:
+            print("Warning: 'plyer' not found. System notifications will be disabled.", file=sys.stderr)
+            print("To enable them, run: pip install plyer", file=sys.stderr)
+    return _notifier
 
+from kivy.cache import Cache
+from kivy.core.text import Label as CoreLabel
 from kivy.graphics import Color, Rectangle, RoundedRectangle
 from kivy.properties import (
     BooleanProperty,
@@ -166,17 +202,17 @@ from kivy.uix.checkbox import CheckBox
 from kivy.uix.filechooser import FileChooserListView
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.uix.recycleview import RecycleView
 from kivy.uix.recycleview.views import RecycleDataViewBehavior
-from kivy.uix.screenmanager import Screen, ScreenManager, SlideTransition
+from kivy.uix.screenmanager import NoTransition, Screen, ScreenManager, SlideTransition
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.spinner import Spinner
 from kivy.uix.textinput import TextInput
 from kivy.config import Config
 Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
 
-from kivybackend import AgendaBackend, PROMPT_TEMPLATE_PASS1, PROMPT_TEMPLATE_PASS2
+from kivybackend import _BRACKET_RE, AgendaBackend, PROMPT_TEMPLATE_PASS1, PROMPT_TEMPLATE_PASS2
 
 # --------------------------------------------------------------------------------------
 # Constants
@@ -204,18 +240,283 @@ COLUMN_SIZES = {
     "notes": 0.35
 }
 
+# Excel reader engine. The Rust-based calamine reader loads sheets several
+# times faster than pandas' default (openpyxl) but is an optional dependency.
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Help screen markup. Filled in by _update_help_text with the configured
+# spreadsheet headers ({date}, {section}, ...) and the scaled heading sizes.
+HELP_TEXT_TEMPLATE = (
+    "[size={title_size}][b]Welcome to the Agenda Summary Generator v5.0![/b][/size]\n\n"
+    "This guide will walk you through using the application, from initial setup to generating your first report.\n\n"
+    
+    "[size={heading_size}][b]First-Time Setup & Model Installing[/b][/size]\n\n"
+    "Before you can generate reports, you need at least one AI model installed. Navigate to Settings and click the Model Settings button to access the Install Models screen.\n\n"
+    "You can add a model in two ways:\n\n"
+    "[b]Internet Install the Recommended Model (From Online)[/b]\n"
+    "This is the easiest way to get started. Click the large button at the bottom to download the recommended model (approx. 2.6 GB). The application will install it for you, which may take a few minutes.\n\n"
+    "[b]Install a Model from a File (Offline)[/b]\n"
+    "This option is for any GGUF-format model saved on your computer or a drive. In the large upload area, click to browse for a .gguf file or drag and drop the file directly onto the zone. The model file will be copied into the application's data folder and become available for use.\n\n"
+    "Once installed, your models will appear in the Available Models dropdown list. Select a model from the dropdown to use it for generation; it will load in the background. You can install multiple models and switch between them. Use the Refresh button to update the list if you've manually added files, and the Delete Model button to remove the currently selected model.\n\n"
+
+    "[size={heading_size}][b]How to Generate a Report[/b][/size]\n\n"
+    "[b]Prepare Your Excel File[/b]\n"
+    "Your data must be in a Microsoft Excel (.xlsx) file. If your file has multiple sheets, the app will prompt you to select the one containing your agenda data.\n"
+    "The selected sheet needs specific column headers. By default, it looks for:\n"
+    "  - \"[b]{date}[/b]\" for the Meeting Date\n"
+    "  - \"[b]{section}[/b]\" for the Agenda Section\n"
+    "  - \"[b]{item}[/b]\" for the Agenda Item Title\n"
+    "  - \"[b]{notes}[/b]\" for any additional notes\n"
+    "  - \"[b]{include}[/b]\" to automatically select an item (cell value '[b]Y[/b]' or '[b]Yes[/b]' — case-insensitive)\n"
+    "For the app to identify agenda items correctly, the date column value must start with a number in [date]-[3-letter-month] format (e.g., 01-Jan or 31-Dec).\n\n"
+
+    "[b]Upload Your File[/b]\n"
+    "On the home screen, drag and drop your .xlsx file onto the large upload area or click the area to open a file browser. If your Excel file has multiple sheets, a popup will ask you to select which sheet to process.\n\n"
+
+    "[b]Review and Select Items[/b]\n"
+    "After uploading, a list of all agenda items found in your file will appear. Items are automatically checked if their Include column is Y or Yes (case-insensitive). Manually check or uncheck any item by clicking on it. Use the Select All and Deselect All buttons for quick changes. Toggle Ignore Bracketed Text in settings to filter out text in brackets.\n\n"
+    
+    "[b]Generate the Summary[/b]\n"
+    "Once satisfied with your selections, click the Generate button. You will see the AI generating the report in real-time on a new screen. Generation time depends on the selected model and your computer hardware. Processing may take longer on slower computers. The output window and debug console (if enabled) will scroll automatically.\n\n"
+
+    "[b]Save or Copy Your Report[/b]\n"
+    "When finished, the Save and Copy buttons will activate. A notification sound will play, and the app window will come to the front. Click Save to export the report as a formatted Microsoft Word (.docx) file, or Copy to place the entire report text on your clipboard. After saving, a confirmation dialog appears with OK and Open File Location buttons to reveal the saved file in your file manager.\n\n"
+
+    "[size={heading_size}][b]Advanced Settings[/b][/size]\n\n"
+    "The Settings screen provides powerful customization options:\n"
+    "• Model Settings: This button takes you to the model installation and management screen, as described in Part 1.\n"
+    "• Spreadsheet Column Headers: If your Excel file uses different header names (e.g., 'Meeting_Date' instead of 'MEETING DATE'), you can change what the app looks for here. Click each button ('Date', 'Section', etc.) to edit the corresponding header name.\n"
+    "• Prompt Templates: Advanced users can edit the instructions (prompts) given to the AI. This allows for fine-tuning the summarization and formatting style.\n"
+    "• Debug Mode: Toggling this on will show a detailed debug console on the generation screen, which is useful for troubleshooting. It displays the exact text sent to the AI and performance metrics like generation speed. For developers.\n"
+    "• Ignore Bracketed Text: When enabled, the app will automatically remove any text found inside square brackets `[]` from your spreadsheet data before sending it to the AI.\n"
+    "• GUI Scale Factor: If UI elements appear too large or too small on your screen, you can adjust the scale. Enter a number (e.g., `1.0` for default, `1.2` for larger, `0.9` for smaller) and click 'Set Scale'. The UI will immediately rescale. A restart is not required.\n"
+    "• Uninstall App: This provides a quick way to completely remove all application data, including the downloaded model, settings, and logs. [b]Settings deletion is irreversible.[/b]\n\n"
+
+    "[size={heading_size}][b]More Information (Video Guide!) & Source Code[/b][/size]\n\n"
+    "For the full documentation, source code, latest releases, and video guide, please visit the GitHub repository:\n"
+    "[ref=github_repo][u][color=4682B4]https://github.com/ningkaiyang/PacificaAutoAgendaWriter[/color][/u][/ref]"
+)
+
+# Number of review rows handed to the RecycleView per frame while a sheet loads
+REVIEW_CHUNK_ROWS = 200
+
+# Bursts of streamed tokens are released over this many frames so the report
+# grows at a steady pace; a backlog this small or smaller is shown at once
+GEN_SMOOTHING_FRAMES = 4
+GEN_SMOOTHING_MIN_BACKLOG = 8
+
+# The debug console only keeps this many trailing lines; TextInput reflows its
+# whole text on every update, so an unbounded log gets slower as a run goes on
+DEBUG_CONSOLE_MAX_LINES = 2000
+
+# Current GUI scale factor, mirrored from PacificaAgendaApp.gui_scale_factor so
+# widget constructors don't have to look the running app up every time.
+SCALE = 1.0
+
 # --------------------------------------------------------------------------------------
 # Native file dialog functions
 # --------------------------------------------------------------------------------------
+# AppleScript sources for the macOS dialogs. The prompt, default filename and
+# allowed extensions arrive through argv, so no text is ever spliced into the
+# script source and it can be compiled once and reused.
+_APPLESCRIPT_SOURCES = {
+    "open": """on run argv
+    set thePrompt to item 1 of argv
+    if (count of argv) > 1 then
+        set theFile to choose file with prompt thePrompt of type (items 2 thru -1 of argv)
+    else
+        set theFile to choose file with prompt thePrompt
+    end if
+    return POSIX path of theFile
+end run""",
+    "save": """on run argv
+    set thePrompt to item 1 of argv
+    set theName to item 2 of argv
+    if theName is "" then
+        set theFile to choose file name with prompt thePrompt
+    else
+        set theFile to choose file name with prompt thePrompt default name theName
+    end if
+    return POSIX path of theFile
+end run""",
+}
+_compiled_applescripts: dict[str, str] = {}
+
+
+def _applescript_command(name: str) -> List[str]:
+    """Return the osascript command for a dialog script, compiling it on first use.
+
+    Falls back to running the source text directly if osacompile fails.
+    """
+    path = _compiled_applescripts.get(name)
+    if path and os.path.exists(path):
+        return ["osascript", path]
+
+    source = _APPLESCRIPT_SOURCES[name]
+    app = App.get_running_app()
+    script_dir = os.path.join(app.user_data_dir if app else tempfile.gettempdir(), "scripts")
+    path = os.path.join(script_dir, f"{name}_dialog.scpt")
+    try:
+        os.makedirs(script_dir, exist_ok=True)
+        result = subprocess.run(
+            ["osacompile", "-o", path, "-e", source],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+    except Exception as e:
+        print(f"could not compile {name} dialog script, running it uncompiled: {e}")
+        return ["osascript", "-e", source]
+
+    _compiled_applescripts[name] = path
+    return ["osascript", path]
+
+
+# JXA (JavaScript for Automation) loop run by one long-lived osascript process.
+# It reads one JSON request per line from stdin, shows the dialog and writes one
+# JSON reply line to stdout, so later dialogs skip the osascript start-up.
+_JXA_DIALOG_SERVER = """
+ObjC.import("Foundation");
+var app = Application.currentApplication();
+app.includeStandardAdditions = true;
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+
+function reply(obj) {
+    stdout.writeData($(JSON.stringify(obj) + "\\n").dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function handle(req) {
+    var opts = {withPrompt: req.prompt};
+    try {
+        var file;
+        if (req.kind === "open") {
+            if (req.types && req.types.length) opts.ofType = req.types;
+            file = app.chooseFile(opts);
+        } else {
+            if (req.name) opts.defaultName = req.name;
+            file = app.chooseFileName(opts);
+        }
+        reply({path: file.toString()});
+    } catch (e) {
+        if (e.errorNumber === -128) reply({cancelled: true});
+        else reply({error: String(e)});
+    }
+}
+
+var buffer = "";
+while (true) {
+    var data = stdin.availableData;
+    if (data.length === 0) break;  // stdin closed: the app has quit
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var nl;
+    while ((nl = buffer.indexOf("\\n")) >= 0) {
+        var line = buffer.slice(0, nl);
+        buffer = buffer.slice(nl + 1);
+        if (line) handle(JSON.parse(line));
+    }
+}
+"""
+
+
+class _OsascriptDialogHelper:
+    """Persistent osascript process that shows the macOS file dialogs.
+
+    request() returns the decoded reply, or None if the helper is unusable, in
+    which case callers fall back to a one-off osascript run. Only one dialog
+    can be open at a time: a request made while another is waiting on the
+    user is turned away with {"busy": True} instead of queueing behind it.
+    """
+
+    def __init__(self):
+        self._proc = None
+        # Held for a whole request, i.e. while the dialog is on screen
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self._ensure_running()
+
+    def _ensure_running(self):
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", "-e", _JXA_DIALOG_SERVER],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+            )
+
+    def request(self, payload: dict) -> dict | None:
+        if not self._lock.acquire(blocking=False):
+            print("osascript dialog helper busy: a dialog is already open")
+            return {"busy": True}
+        try:
+            self._ensure_running()
+            proc = self._proc
+            proc.stdin.write(json.dumps(payload) + "\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError("dialog helper exited")
+            reply = json.loads(line)
+        except Exception as e:
+            print(f"osascript dialog helper failed: {e}")
+            self.stop()
+            return None
+        finally:
+            self._lock.release()
+        if "error" in reply:
+            print(f"osascript dialog helper error: {reply['error']}")
+            return None
+        return reply
+
+    def stop(self):
+        """End the helper process. Never waits on the request lock, so quitting
+        while a dialog is open does not hang until the user closes it."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if self._lock.locked():
+            # A dialog is up and the JXA loop is not reading stdin
+            proc.kill()
+            return
+        try:
+            proc.stdin.close()  # ends the JXA read loop
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+
+
+_dialog_helper = _OsascriptDialogHelper()
+
+
+_TK_ROOT = None
+
+
+def _get_tk_root():
+    """Return a hidden Tk root shared by every Windows file dialog.
+
+    Creating a Tk interpreter is slow, so it is built once and never destroyed.
+    """
+    global _TK_ROOT
+    if _TK_ROOT is None:
+        import tkinter as tk
+        _TK_ROOT = tk.Tk()
+        _TK_ROOT.withdraw()  # Hide the main window
+    return _TK_ROOT
+
+
 def native_open_file_dialog(title="Select File", file_types=None, multiple=False):
     """open file dialog using native OS dialogs (macOS via osascript, Windows via tkinter)"""
     if platform == 'win':
         try:
-            import tkinter as tk
             from tkinter import filedialog
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
+            root = _get_tk_root()
             filepath = filedialog.askopenfilename(
+                parent=root,
                 title=title,
                 filetypes=file_types
             )
@@ -226,30 +527,27 @@ def native_open_file_dialog(title="Select File", file_types=None, multiple=False
 
     elif platform == "macosx":
         try:
-            # Build the base AppleScript command
-            script = f'choose file with prompt "{title}"'
-
-            # Dynamically build the 'of type' clause from file_types
+            # Allowed extensions from file_types become extra script arguments
+            allowed_extensions = []
             if file_types:
-                allowed_extensions = []
                 for _, pattern in file_types:
                     # Filter out wildcards like '*.*' and get the extension
                     if pattern.startswith("*.") and pattern != "*.*":
                         allowed_extensions.append(pattern[2:])
-                
-                if allowed_extensions:
-                    # Format for AppleScript: {"ext1", "ext2"}
-                    type_list = ", ".join(f'"{ext}"' for ext in allowed_extensions)
-                    script += f' of type {{{type_list}}}'
-            
-            # Finalize the script for osascript
-            full_script = f'''
-            set theFile to {script}
-            return POSIX path of theFile
-            '''
-            
+
+            reply = _dialog_helper.request({"kind": "open", "prompt": title, "types": allowed_extensions})
+            if reply is not None:
+                if reply.get("busy"):
+                    return []  # another dialog is still open
+                if reply.get("cancelled"):
+                    print("Native open dialog cancelled by user.")
+                    return []
+                print(f"native open dialog returned: {reply['path']}")  # debug
+                return [reply["path"]]
+
+            # Helper unavailable: run the dialog script on its own
             result = subprocess.run(
-                ["osascript", "-e", full_script],
+                _applescript_command("open") + [title] + allowed_extensions,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -275,11 +573,10 @@ def native_save_file_dialog(title="Save File", filename="", file_types=None):
     """save file dialog using native OS dialogs (macOS via osascript, Windows via tkinter)"""
     if platform == 'win':
         try:
-            import tkinter as tk
             from tkinter import filedialog
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
+            root = _get_tk_root()
             filepath = filedialog.asksaveasfilename(
+                parent=root,
                 title=title,
                 initialfile=filename,
                 filetypes=file_types,
@@ -290,17 +587,19 @@ def native_save_file_dialog(title="Save File", filename="", file_types=None):
             print(f"native file dialog error on windows: {e}")
     elif platform == "macosx":
         try:
-            # build applescript for save dialog that returns POSIX path directly
-            script = f'''
-            set theFile to choose file name with prompt "{title}"'''
-            if filename:
-                script += f' default name "{filename}"'
-            script += '''
-            return POSIX path of theFile
-            '''
-            
+            reply = _dialog_helper.request({"kind": "save", "prompt": title, "name": filename or ""})
+            if reply is not None:
+                if reply.get("busy"):
+                    return ""  # another dialog is still open
+                if reply.get("cancelled"):
+                    print("Native save dialog cancelled by user.")
+                    return ""
+                print(f"native save dialog returned: {reply['path']}")  # debug
+                return reply["path"]
+
+            # Helper unavailable: run the dialog script on its own
             result = subprocess.run(
-                ["osascript", "-e", script],
+                _applescript_command("save") + [title, filename or ""],
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -321,23 +620,98 @@ def native_save_file_dialog(title="Save File", filename="", file_types=None):
     
     return None  # fallback needed
 
+
+def run_native_dialog(dialog_func: Callable, callback: Callable, **kwargs):
+    """Run a native dialog and pass its result to *callback* on the Kivy thread.
+
+    osascript dialogs run on a worker thread so the Kivy clock keeps ticking
+    while the dialog is up. Tk dialogs stay on the calling thread because the
+    shared Tk root may only be used from the thread that created it.
+    """
+    if platform != "macosx":
+        callback(dialog_func(**kwargs))
+        return
+
+    def _worker():
+        mainthread(callback)(dialog_func(**kwargs))
+
+    threading.Thread(target=_worker, daemon=True).start()
+
+
+def _ensure_docx(path: str) -> str:
+    """Append '.docx' unless *path* already ends with it (case-insensitive)."""
+    return path if path[-5:].lower() == ".docx" else path + ".docx"
+
+
 # --------------------------------------------------------------------------------------
 # Helper widgets
 # --------------------------------------------------------------------------------------
+@lru_cache(maxsize=128)
+def _hex2rgba_cached(hx: str, alpha: float) -> tuple:
+    """'#RRGGBB' + alpha -> (r, g, b, a) floats. Only a handful of colours are
+    used, so results are cached; tuples keep the cached values immutable."""
+    hx = hx.lstrip("#")
+    return tuple(int(hx[i : i + 2], 16) / 255.0 for i in (0, 2, 4)) + (alpha,)
+
+
+def _sync_text_size(inst, *_):
+    """Wrap a label's text to its current width (bind to size or width)."""
+    inst.text_size = (inst.width, None)
+
+
+def _sync_text_size_inset(inst, *_):
+    """Like _sync_text_size, but keep a 20px margin on each side."""
+    inst.text_size = (inst.width - 40, None)
+
+
+def _sync_height_to_texture(inst, *_):
+    """Grow a label vertically to fit its rendered text."""
+    inst.height = inst.texture_size[1]
+
+
+# Fixed palette colours used on selection/hover/resize paths, parsed once
+WHITE_RGBA = (1.0, 1.0, 1.0, 1.0)
+BLACK_RGBA = (0.0, 0.0, 0.0, 1.0)
+PACIFICA_BLUE_SEL = _hex2rgba_cached(PACIFICA_BLUE, 0.3)    # selected review row
+PACIFICA_BLUE_HDR = _hex2rgba_cached(PACIFICA_BLUE, 0.2)    # review table header
+UPLOAD_OVERLAY_RGBA = _hex2rgba_cached(PACIFICA_BLUE, 0.4)  # upload zone, normal
+UPLOAD_OVERLAY_HOVER_RGBA = _hex2rgba_cached(PACIFICA_BLUE, 0.7)
+SETUP_OVERLAY_RGBA = _hex2rgba_cached("#D9534F", 0.7)       # upload zone, model not installed
+SETUP_OVERLAY_HOVER_RGBA = _hex2rgba_cached("#D9534F", 0.9)
+
+
+# Bumped when widgets can move on screen without their own pos changing (screen
+# transitions, window resizes) so StyledButton re-measures its cached bounds.
+_hover_epoch = 0
+
+
+def _bump_hover_epoch(*_):
+    global _hover_epoch
+    _hover_epoch += 1
+
+
+# Shadow opacity for each StyledButton state
+BUTTON_SHADOW_ALPHA = {'normal': 0.2, 'hover': 0.4, 'pressed': 0.1}
+
+
 class StyledButton(Button):
     """Flat button with Pacifica colours, rounded corners, shadow, and hover effect."""
     is_hovered = BooleanProperty(False)
+    _win_bbox = None      # (hover epoch, x, y, right, top) in window coordinates
+    _in_scroller = None   # whether an ancestor is a ScrollView (checked lazily)
+    _parked_top = None    # detached subtree root watched while hover is parked
     # A ListProperty to store the base RGBA color of the button.
     # This will be used by _update_color for all state changes.
     base_bg_color_rgba = ListProperty([0, 0, 0, 0]) # Initial dummy value, will be set in __init__
 
     def __init__(self, bg_color_name_override: str | None = None, **kw):
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+        scale = SCALE
+        self._scale = scale
 
         # Determine the initial base color based on override or default
         initial_hex_color = bg_color_name_override if bg_color_name_override else PACIFICA_BLUE
-        self.base_bg_color_rgba = self.hex2rgba(initial_hex_color, 1.0)
+        self.base_bg_color_rgba = list(self.hex2rgba(initial_hex_color, 1.0))
+        self._colors = self._state_colors(self.base_bg_color_rgba)
 
         # set a default font_size if not provided by the caller
         if "font_size" not in kw:
@@ -353,19 +727,22 @@ class StyledButton(Button):
         super().__init__(
             background_normal="",
             background_color=[0, 0, 0, 0],  # transparent background
-            color=[1, 1, 1, 1],
+            color=WHITE_RGBA,
             **kw,
         )
         
-        # bind to mouse position to check for hover
-        Window.bind(mouse_pos=self.on_mouse_pos)
+        # hover tracking (Window mouse_pos) is bound in on_parent while the
+        # button is part of a widget tree
+        # pos and size usually change together (e.g. on window resize); a trigger
+        # coalesces them into a single _update_rect, run before the frame is drawn.
+        self._rect_trigger = Clock.create_trigger(self._update_rect, -1)
         # Bind _update_color to relevant properties including base_bg_color_rgba
         self.bind(
-            pos=self._update_rect,
-            size=self._update_rect,
+            pos=self._rect_trigger,
+            size=self._rect_trigger,
             state=self._update_color,
             is_hovered=self._update_color,
-            base_bg_color_rgba=self._update_color
+            base_bg_color_rgba=self._on_base_bg_color
         )
 
         with self.canvas.before:
@@ -377,53 +754,123 @@ class StyledButton(Button):
             self.bg_color = Color(*self.base_bg_color_rgba)
             self.rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[15 * scale])
 
+    def on_parent(self, _instance, parent):
+        """bind hover tracking while attached; unbind on removal so Window's
+        mouse_pos callbacks do not pile up as screens are rebuilt"""
+        self._win_bbox = None
+        self._in_scroller = None
+        self._unwatch_top()
+        if parent is None:
+            Window.unbind(mouse_pos=self.on_mouse_pos)
+            self.is_hovered = False
+        else:
+            # binding an already bound method is a no-op, so re-parenting is safe
+            Window.bind(mouse_pos=self.on_mouse_pos)
+
+    def _park_hover(self):
+        """stop hover tracking while the button's tree is off the window.
+
+        Clearing a screen or dismissing a popup detaches the subtree root, not
+        the button itself, so on_parent never sees it. Instead the binding is
+        dropped here and restored when that detached root gets a parent again
+        (e.g. an inactive screen being switched back in).
+        """
+        Window.unbind(mouse_pos=self.on_mouse_pos)
+        self.is_hovered = False
+        top = self
+        while top.parent is not None and top.parent is not Window:
+            top = top.parent
+        if top is not self:  # the button's own parent is handled by on_parent
+            self._parked_top = top
+            top.fbind('parent', self._on_top_parent)
+
+    def _unwatch_top(self):
+        if self._parked_top is not None:
+            self._parked_top.funbind('parent', self._on_top_parent)
+            self._parked_top = None
+
+    def _on_top_parent(self, *_):
+        self._unwatch_top()
+        self._win_bbox = None
+        self._in_scroller = None
+        if self.get_root_window():
+            Window.bind(mouse_pos=self.on_mouse_pos)
+        else:
+            self._park_hover()  # attached to another detached tree
+
     def on_mouse_pos(self, *args):
         """check if mouse is over the button"""
         if not self.get_root_window():
-            return  # do nothing if button is not displayed
+            self._park_hover()  # not displayed: release the Window binding
+            return
         
-        pos = args[1]
+        mx, my = args[1]
+        if self._in_scroller is None:
+            # Scrolling moves a button without changing its pos, so buttons in
+            # a ScrollView always take the full transform below.
+            self._in_scroller = any(isinstance(w, ScrollView) for w in self._ancestors())
+
+        if not self._in_scroller:
+            # Cheap reject against the button's cached window-space bounds
+            bbox = self._win_bbox
+            if bbox is None or bbox[0] != _hover_epoch:
+                x, y = self.to_window(self.x, self.y)
+                bbox = self._win_bbox = (_hover_epoch, x, y, x + self.width, y + self.height)
+            if not (bbox[1] <= mx <= bbox[3] and bbox[2] <= my <= bbox[4]):
+                if self.is_hovered:
+                    self.is_hovered = False
+                return
+
         # check if cursor is within button bounds
-        inside = self.collide_point(*self.to_widget(*pos))
+        inside = self.collide_point(*self.to_widget(mx, my))
         if self.is_hovered != inside:
             self.is_hovered = inside
 
+    def _ancestors(self):
+        widget = self.parent
+        while widget is not None and widget is not Window:
+            yield widget
+            widget = getattr(widget, "parent", None)
+
     def _update_rect(self, *_):
         """update both shadow and main rectangle"""
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+        self._win_bbox = None  # moved/resized: re-measure on the next mouse move
         # shadow is slightly offset
-        shadow_offset = 3 * scale
+        shadow_offset = 3 * self._scale
         self.shadow.pos = (self.pos[0] + shadow_offset, self.pos[1] - shadow_offset)
         self.shadow.size = self.size
         
         self.rect.pos = self.pos
         self.rect.size = self.size
 
-    def _update_color(self, *_):
-        """update color based on state (normal, hover, down)"""
-        # Get the current base color from the property
-        r, g, b, a = self.base_bg_color_rgba
-
-        if self.state == 'down':
+    @staticmethod
+    def _state_colors(rgba):
+        """precompute the background colour for each button state from a base colour"""
+        r, g, b, a = rgba
+        return {
             # Darker color when pressed (e.g., 70% intensity)
-            current_r, current_g, current_b = [min(1.0, max(0.0, c * 0.7)) for c in (r, g, b)]
-            self.bg_color.rgba = [current_r, current_g, current_b, a]
-            self.shadow_color.a = 0.1 # less shadow when pressed
-        elif self.is_hovered:
+            'pressed': tuple(min(1.0, max(0.0, c * 0.7)) for c in (r, g, b)) + (a,),
             # Lighter color on hover (e.g., 15% lighter)
-            current_r, current_g, current_b = [min(1.0, max(0.0, c * 1.15)) for c in (r, g, b)]
-            self.bg_color.rgba = [current_r, current_g, current_b, a]
-            self.shadow_color.a = 0.4 # more prominent shadow on hover
-        else:
-            # Normal state, use the base color
-            self.bg_color.rgba = self.base_bg_color_rgba
-            self.shadow_color.a = 0.2 # normal shadow
+            'hover': tuple(min(1.0, max(0.0, c * 1.15)) for c in (r, g, b)) + (a,),
+            'normal': (r, g, b, a),
+        }
+
+    def _color_state(self):
+        return 'pressed' if self.state == 'down' else 'hover' if self.is_hovered else 'normal'
+
+    def _on_base_bg_color(self, _instance, value):
+        self._colors = self._state_colors(value)
+        self._update_color()
+
+    def _update_color(self, *_):
+        """update color based on state (normal, hover, down)"""
+        key = self._color_state()
+        self.bg_color.rgba = self._colors[key]
+        self.shadow_color.a = BUTTON_SHADOW_ALPHA[key]
 
     @staticmethod
     def hex2rgba(hx: str, alpha=1.0):
-        hx = hx.lstrip("#")
-        return [int(hx[i : i + 2], 16) / 255.0 for i in (0, 2, 4)] + [alpha]
+        return _hex2rgba_cached(hx, alpha)
 
 
 class TogglableStyledButton(StyledButton):
@@ -462,26 +909,25 @@ class TogglableStyledButton(StyledButton):
 
     def _update_color(self, *_):
         """Override to integrate active state into hover/down logic."""
-        if self.active:
-            # Green shades for "Enabled"
-            base_color = "#5CB85C"
-            hover_color = "#6DC06D"
-            pressed_color = "#4CAF50"
-        else:
-            # Red shades for "Disabled"
-            base_color = "#D9534F"
-            hover_color = "#E06B68"
-            pressed_color = "#C9302C"
-
-        if self.state == 'down':
-            self.bg_color.rgba = self.hex2rgba(pressed_color, 0.9)
-            self.shadow_color.a = 0.1
-        elif self.is_hovered:
-            self.bg_color.rgba = self.hex2rgba(hover_color, 1.0)
-            self.shadow_color.a = 0.4
-        else:
-            self.bg_color.rgba = self.hex2rgba(base_color, 1.0)
-            self.shadow_color.a = 0.2
+        # Green shades for "Enabled", red shades for "Disabled"
+        key = self._color_state()
+        self.bg_color.rgba = TOGGLE_BUTTON_COLORS[self.active][key]
+        self.shadow_color.a = BUTTON_SHADOW_ALPHA[key]
+
+
+# Precomputed state colours shared by every TogglableStyledButton, keyed by active flag.
+TOGGLE_BUTTON_COLORS = {
+    True: {
+        'normal': StyledButton.hex2rgba("#5CB85C", 1.0),
+        'hover': StyledButton.hex2rgba("#6DC06D", 1.0),
+        'pressed': StyledButton.hex2rgba("#4CAF50", 0.9),
+    },
+    False: {
+        'normal': StyledButton.hex2rgba("#D9534F", 1.0),
+        'hover': StyledButton.hex2rgba("#E06B68", 1.0),
+        'pressed': StyledButton.hex2rgba("#C9302C", 0.9),
+    },
+}
 
 
 class ToggleSwitch(BoxLayout):
@@ -491,7 +937,7 @@ class ToggleSwitch(BoxLayout):
 
     def __init__(self, text: str, initial: bool, callback, **kw):
         super().__init__(orientation="horizontal", spacing=10, size_hint_y=None, height=32, **kw)
-        self.add_widget(Label(text=text, color=[0, 0, 0, 1], size_hint_x=0.8, halign="left", valign="middle"))
+        self.add_widget(Label(text=text, color=BLACK_RGBA, size_hint_x=0.8, halign="left", valign="middle"))
         cb = CheckBox(active=initial)
         cb.bind(active=lambda _, v: callback(v))
         self.add_widget(cb)
@@ -501,8 +947,7 @@ class UploadZone(BoxLayout):
     """Unified drag-and-drop and click upload zone."""
 
     def __init__(self, app_instance, filetype: str = "xlsx", **kw):
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+        scale = SCALE
 
         super().__init__(
             orientation="vertical",
@@ -518,12 +963,14 @@ class UploadZone(BoxLayout):
 
         # create the visual background
         with self.canvas.before:
-            Color(*StyledButton.hex2rgba("#FFFFFF", 1))  # white base background
+            Color(*WHITE_RGBA)  # white base background
             self._bg_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[15 * scale])
-            self.overlay_color = Color(*StyledButton.hex2rgba(PACIFICA_BLUE, 0.4))  # blue overlay
+            self.overlay_color = Color(*UPLOAD_OVERLAY_RGBA)  # blue overlay
             self._overlay_rect = RoundedRectangle(pos=self.pos, size=self.size, radius=[15 * scale])
 
-        self.bind(pos=self._update_canvas, size=self._update_canvas)
+        # Coalesce pos+size changes into one canvas update before the frame is drawn
+        self._canvas_trigger = Clock.create_trigger(self._update_canvas, -1)
+        self.bind(pos=self._canvas_trigger, size=self._canvas_trigger)
 
         # main upload text/button
         self.upload_label = Label(
@@ -531,7 +978,7 @@ class UploadZone(BoxLayout):
             markup=True,
             halign="center",
             valign="middle",
-            color=[1, 1, 1, 1],  # white text for visibility on blue background
+            color=WHITE_RGBA,  # white text for visibility on blue background
         )
         self.upload_label.bind(size=self._update_text_size)
         self.add_widget(self.upload_label)
@@ -549,21 +996,20 @@ class UploadZone(BoxLayout):
             size_hint_y=None,
             height=35 * scale,
         )
-        self.hint_label.bind(size=lambda inst, *_: inst.setter("text_size")(inst, (inst.width, None)))
+        self.hint_label.bind(size=_sync_text_size)
         self.add_widget(self.hint_label)
 
     def set_uninstalled_state(self, is_uninstalled):
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+        scale = SCALE
         self.is_uninstalled_state = is_uninstalled
         if is_uninstalled:
             self.upload_label.text = f"[size={int(48 * scale)}][b]Setup Required[/b][/size]\n[size={int(28 * scale)}]Please go to Settings to install the model.[/size]"
             self.hint_label.text = ""
-            self.overlay_color.rgba = StyledButton.hex2rgba("#D9534F", 0.7) # Red
+            self.overlay_color.rgba = SETUP_OVERLAY_RGBA # Red
         else:
             self.upload_label.text = f"[size={int(48 * scale)}][b]Click to Upload Excel File[/b][/size]\n[size={int(28 * scale)}]or drag and drop your file here[/size]"
             self.hint_label.text = f"[size={int(22 * scale)}]Supported format: Excel files (.xlsx)[/size]"
-            self.overlay_color.rgba = StyledButton.hex2rgba(PACIFICA_BLUE, 0.4) # Blue
+            self.overlay_color.rgba = UPLOAD_OVERLAY_RGBA # Blue
         self._set_hover_state(False)
 
 
@@ -602,11 +1048,11 @@ class UploadZone(BoxLayout):
         """update visual appearance for hover/press state"""
         self.is_hovered = hovered
         if self.is_uninstalled_state:
-            base_color = StyledButton.hex2rgba("#D9534F", 0.7)
-            hover_color = StyledButton.hex2rgba("#D9534F", 0.9)
+            base_color = SETUP_OVERLAY_RGBA
+            hover_color = SETUP_OVERLAY_HOVER_RGBA
         else:
-            base_color = StyledButton.hex2rgba(PACIFICA_BLUE, 0.4)
-            hover_color = StyledButton.hex2rgba(PACIFICA_BLUE, 0.7)
+            base_color = UPLOAD_OVERLAY_RGBA
+            hover_color = UPLOAD_OVERLAY_HOVER_RGBA
 
         if hovered:
             self.overlay_color.rgba = hover_color
@@ -619,8 +1065,7 @@ class ModelUploadZone(UploadZone):
     def __init__(self, app_instance, **kw):
         super().__init__(app_instance, filetype="gguf", **kw)
         # Overwrite labels for model install context
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+        scale = SCALE
         self.upload_label.text = (
             f"[size={int(48*scale)}][b]Click to Install Model[/b][/size]\n"
             f"[size={int(28*scale)}]or drag and drop your .gguf file here[/size]"
@@ -629,24 +1074,96 @@ class ModelUploadZone(UploadZone):
 
 
 # --------------------------------------------------------------------------------------
-# Simple item widget for the list
+# Item view for the review RecycleView
 # --------------------------------------------------------------------------------------
-class AgendaItem(BoxLayout):
-    def __init__(self, date_text, section_text, item_text, notes_text, index, app, **kwargs):
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
+# Rendered review cell textures, keyed by (text, wrap width, font size). Lets a
+# recycled row that is scrolled back into view reuse its texture instead of
+# laying the text out again.
+Cache.register("review.cell_texture", limit=512)
+
+
+class TextCell(Widget):
+    """Plain (markup-free) wrapped text drawn straight from a cached texture.
+
+    Stands in for a Label in the review rows: the text is only laid out when
+    the text or the wrap width actually changes, and identical cells share a
+    texture through the Cache.
+    """
+    text = StringProperty("")
+    text_width = NumericProperty(0)  # wrap width; 0 means "not laid out yet"
+    texture_size = ListProperty([0, 0])
+
+    def __init__(self, font_size, **kwargs):
+        super().__init__(**kwargs)
+        self.font_size = font_size
+        with self.canvas:
+            Color(1, 1, 1, 1)  # text colour is baked into the texture
+            self._text_rect = Rectangle(pos=self.pos, size=(0, 0))
+
+        # text and text_width usually change together on a recycle. Timeout -1
+        # (as Label uses for its texture) renders before the frame is drawn,
+        # so a recycled cell never shows the previous row's texture.
+        self._render_trigger = Clock.create_trigger(self._render, -1)
+        self.bind(text=self._render_trigger, text_width=self._render_trigger)
+        self.bind(pos=self._update_text_pos, size=self._update_text_pos)
+
+    def _render(self, *_):
+        if not self.text or self.text_width <= 0:
+            texture = None
+        else:
+            key = (self.text, int(self.text_width), self.font_size)
+            texture = Cache.get("review.cell_texture", key)
+            if texture is None:
+                core = CoreLabel(
+                    text=self.text,
+                    font_size=self.font_size,
+                    text_size=(self.text_width, None),
+                    halign="left",
+                    valign="top",
+                    color=BLACK_RGBA,
+                )
+                core.refresh()
+                texture = core.texture
+                Cache.append("review.cell_texture", key, texture)
+
+        self._text_rect.texture = texture
+        self._text_rect.size = texture.size if texture else (0, 0)
+        self.texture_size = list(self._text_rect.size)
+        self._update_text_pos()
+
+    def _update_text_pos(self, *_):
+        # top-aligned, like a Label with valign="top"
+        self._text_rect.pos = (self.x, self.top - self._text_rect.size[1])
+
+
+class SelectableItem(RecycleDataViewBehavior, BoxLayout):
+    """Recycled review row: checkbox + date/section/item/notes columns.
+
+    Only enough of these to fill the viewport are ever created. Row texts and
+    measured heights live in the RecycleView's data dicts and the selection in
+    the app's selection_mask, so a recycled view simply re-reads them in
+    refresh_view_attrs().
+    """
+    index = None
+    selected = BooleanProperty(False)
+    selectable = BooleanProperty(True)
+
+    def __init__(self, **kwargs):
+        scale = SCALE
         # Overall padding for the entire row (checkbox + columns)
         super().__init__(orientation="horizontal", padding=(20 * scale, 15 * scale), spacing=15 * scale, size_hint_y=None, **kwargs)
-        
-        self.app = app
-        self.index = index
-        self.selected = True  # start selected by default
-        
+        self.rv = None
+
+        # Background is drawn once and only recoloured/moved afterwards
+        with self.canvas.before:
+            self._bg_color = Color(*WHITE_RGBA)
+            self._bg_rect = Rectangle(pos=self.pos, size=self.size)
+
         # Checkbox for selection
-        self.checkbox = CheckBox(active=True, size_hint_x=None, width=40 * scale)
+        self.checkbox = CheckBox(active=False, size_hint_x=None, width=40 * scale)
         self.checkbox.bind(active=self.on_checkbox_toggle)
         self.add_widget(self.checkbox)
-        
+
         # Container for all columnar labels
         self.columns_container = BoxLayout(
             orientation="horizontal",
@@ -657,226 +1174,161 @@ class AgendaItem(BoxLayout):
         self.add_widget(self.columns_container)
 
         # Individual labels for each column
-        self.date_label = self._create_label(date_text, COLUMN_SIZES["date"])
-        self.section_label = self._create_label(section_text, COLUMN_SIZES["section"])
-        self.item_label = self._create_label(item_text, COLUMN_SIZES["item"])
-        self.notes_label = self._create_label(notes_text, COLUMN_SIZES["notes"])
-        
+        self.date_label = self._create_label(COLUMN_SIZES["date"])
+        self.section_label = self._create_label(COLUMN_SIZES["section"])
+        self.item_label = self._create_label(COLUMN_SIZES["item"])
+        self.notes_label = self._create_label(COLUMN_SIZES["notes"])
+
         self.columns_container.add_widget(self.date_label)
         self.columns_container.add_widget(self.section_label)
         self.columns_container.add_widget(self.item_label)
         self.columns_container.add_widget(self.notes_label)
-        
+
         self.column_labels = [self.date_label, self.section_label, self.item_label, self.notes_label]
 
-        # Bind to columns_container's width to recalculate text_size for its children
-        self.columns_container.bind(width=self._update_column_layout)
-        # Bind each label's texture_size to re-evaluate the overall row height
+        # Horizontal space inside columns_container not available to the labels
+        # (its own padding plus the gaps between columns). Fixed for the life of
+        # the row, so it is worked out once here.
+        container = self.columns_container
+        self._pad_overhead = (
+            container.padding[0] + container.padding[2]
+            + container.spacing * (len(self.column_labels) - 1)
+        )
+        self._last_avail = None
+
+        # Bind to columns_container's width to recalculate the wrap width of its cells.
+        # A trigger runs the update once however often the width changes; -1
+        # runs it before the frame is drawn so wrap and height settle together.
+        self._column_layout_trigger = Clock.create_trigger(self._update_column_layout, -1)
+        self.columns_container.bind(width=self._column_layout_trigger)
+        # Bind each label's texture_size to re-evaluate the overall row height.
+        # All four labels usually change together, so the measurement is
+        # coalesced into a single _recompute_height pass.
+        self._height_pending = False
         for label in self.column_labels:
             label.bind(texture_size=self._on_label_texture_size)
-        
-        # Set initial background after widget is fully constructed
-        from kivy.clock import Clock
-        Clock.schedule_once(lambda dt: self._setup_initial_size(), 0)
-    
-    def _create_label(self, text, size_hint_x_val):
+
+        # Bind the selected property to update checkbox and background
+        self.bind(selected=self.on_selected_change)
+
+    def _create_label(self, size_hint_x_val):
         """Helper to create consistently styled column labels."""
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
-        return Label(
-            text=text,
-            markup=False,
-            text_size=(None, None),  # Will be set dynamically
-            halign="left",
-            valign="top",  # Align to top for multi-line text
-            color=[0, 0, 0, 1],
+        scale = SCALE
+        return TextCell(
             size_hint_x=size_hint_x_val,
             size_hint_y=None,  # Important: don't let label stretch vertically by default
             font_size=26 * scale
         )
-    
-    def _setup_initial_size(self):
-        """Setup initial text size and height after widget is constructed."""
-        # Trigger layout update, which will in turn calculate label text_size and item height.
-        self._update_column_layout()
-        self.update_background()
-    
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Called when the view is (re)bound to a row of rv.data."""
+        self.rv = rv
+        self.index = index
+
+        # Update the content from data
+        self.date_label.text = data.get("date", "")
+        self.section_label.text = data.get("section", "")
+        self.item_label.text = data.get("item", "")
+        self.notes_label.text = data.get("notes", "")
+
+        result = super().refresh_view_attrs(rv, index, data)
+        # Selection lives in the app's mask, not the data dicts, so select-all
+        # never has to touch every row (setting it also syncs the checkbox)
+        self.selected = bool(rv.app.selection_mask[index])
+        # A recycled view whose cells wrap to the same size as the previous
+        # row's gets no texture_size event, so measure unmeasured rows here
+        if "height" not in data:
+            self._on_label_texture_size()
+        return result
+
     def _update_column_layout(self, *args):
-        """Dynamically update text_size for all column labels based on container width."""
+        """Dynamically update the wrap width of all column labels based on container width."""
         # Calculate available width for the labels within columns_container
-        # This accounts for columns_container's own internal padding and spacing
-        available_width_for_labels = (
-            self.columns_container.width
-            - (self.columns_container.padding[0] + self.columns_container.padding[2])
-            - (self.columns_container.spacing * (len(self.column_labels) - 1))
-        )
-        
-        if available_width_for_labels <= 0:
+        available_width_for_labels = self.columns_container.width - self._pad_overhead
+
+        if available_width_for_labels <= 0 or available_width_for_labels == self._last_avail:
             return
+        self._last_avail = available_width_for_labels
 
         for label in self.column_labels:
             # Calculate actual width for each label based on its size_hint_x
             label_actual_width = available_width_for_labels * label.size_hint_x
-            if label_actual_width > 0:
-                label.text_size = (label_actual_width, None) # Set width, height will adjust automatically
-    
-    def _on_label_texture_size(self, instance, texture_size):
+            # Only touch the wrap width (and re-render the texture) when it really changed
+            if label_actual_width > 0 and abs(label_actual_width - label.text_width) > 0.5:
+                label.text_width = label_actual_width # height will adjust automatically
+
+    def _on_label_texture_size(self, *args):
         """Callback when any individual label's rendered text size changes."""
-        # Update the specific label's height to match its content
-        instance.height = texture_size[1]
-        
-        # Find the maximum height among all column labels to determine row height
+        if self._height_pending:
+            return
+        self._height_pending = True
+        # -1: measure before this frame is drawn, not on the next one
+        Clock.schedule_once(self._recompute_height, -1)
+
+    def _recompute_height(self, *args):
+        """Size the labels to their text and store the resulting row height."""
+        self._height_pending = False
+
+        # Update each label's height to match its content and find the tallest one
         max_label_height = 0
         for label in self.column_labels:
-            max_label_height = max(max_label_height, label.texture_size[1] if label.texture_size else 0)
-            
+            label_height = label.texture_size[1] if label.texture_size else 0
+            label.height = label_height
+            max_label_height = max(max_label_height, label_height)
+
         # Set the height of the columns_container to fit the tallest label plus its vertical padding
         self.columns_container.height = max_label_height + (self.columns_container.padding[1] + self.columns_container.padding[3])
-        
-        app = App.get_running_app()
-        scale = app.gui_scale_factor if app else 1.0
-        # Set the overall AgendaItem (row) height, ensuring a minimum height
-        self.height = max(50 * scale, self.columns_container.height + (self.padding[1] + self.padding[3]))
 
-    
-    def on_size(self, *args):
-        """Update background when widget size changes."""
-        self.update_background()
-        # No need to call _update_column_layout or _draw_column_separators directly here
-        # as columns_container.width/pos binding handles it.
-    
-    def on_checkbox_toggle(self, checkbox, value):
-        """handle checkbox toggle"""
-        self.selected = value
-        self.update_background()
-        
-        if value:
-            self.app.mark_selected(self.index)
-        else:
-            self.app.mark_deselected(self.index)
-    
-    def on_touch_down(self, touch):
-        """make the entire row clickable"""
-        if self.collide_point(*touch.pos):
-            # toggle selection when clicked anywhere on the row
-            self.checkbox.active = not self.checkbox.active
-            return True
-        return super().on_touch_down(touch)
-    
-    def update_background(self):
-        """update background color based on selection"""
-        if not self.canvas:  # check if canvas exists
+        scale = SCALE
+        # The row height lives in the data dict so the layout can position
+        # every row (including ones not currently on screen) correctly.
+        height = max(50 * scale, self.columns_container.height + (self.padding[1] + self.padding[3]))
+        if self.rv is None or self.index is None or self.index >= len(self.rv.data):
             return
-            
-        self.canvas.before.clear()
-        with self.canvas.before:
-            if self.selected:
-                Color(*StyledButton.hex2rgba(PACIFICA_BLUE, 0.3))  # light blue background
-            else:
-                Color(*StyledButton.hex2rgba("#FFFFFF", 1.0))  # white background
-            Rectangle(pos=self.pos, size=self.size)
-    
-    def on_pos(self, *args):
-        """update background rectangle when position changes"""
-        self.update_background()
-
-
-# --------------------------------------------------------------------------------------
-# Item view for the RecycleView (keeping for potential future use)
-# --------------------------------------------------------------------------------------
-class SelectableItem(RecycleDataViewBehavior, BoxLayout):
-    index = None
-    selected = BooleanProperty(False)
-    selectable = BooleanProperty(True)
-
-    def __init__(self, **kwargs):
-        super().__init__(orientation="horizontal", spacing=10, size_hint_y=None, height=50, **kwargs)
-        
-        # Create a checkbox to show selection state
-        self.checkbox = CheckBox(active=False, size_hint_x=None, width=40)
-        self.checkbox.bind(active=self.on_checkbox_toggle)
-        self.add_widget(self.checkbox)
-        
-        # Create label for the text content
-        self.label = Label(
-            text="",
-            markup=True,
-            text_size=(None, None),
-            halign="left",
-            valign="middle",
-            color=[0, 0, 0, 1],
-            size_hint_x=1
-        )
-        self.label.bind(size=self._update_text_size)
-        self.add_widget(self.label)
-        
-        # Bind the selected property to update checkbox
-        self.bind(selected=self.on_selected_change)
-    
-    def _update_text_size(self, *args):
-        # Update text_size when label size changes for proper text wrapping
-        self.label.text_size = (self.label.width, None)
+        row = self.rv.data[self.index]
+        if abs(row.get("height", 0) - height) > 1:
+            # Item assignment refreshes just this row, not the whole list
+            self.rv.data[self.index] = {**row, "height": height}
 
-    def refresh_view_attrs(self, rv, index, data):
-        """Called when the view is recycled"""
-        self.index = index
-        
-        # Update the content from data
-        self.label.text = data.get("text", "")
-        self.label.markup = data.get("markup", True)
-        self.height = data.get("height", 50)
-        
-        # Update selection state from data
-        self.selected = data.get("selected", False)
-        
-        return super().refresh_view_attrs(rv, index, data)
-    
     def on_selected_change(self, instance, value):
         """Update checkbox when selected property changes"""
         self.checkbox.active = value
-        
+
         # Update background color based on selection
-        if hasattr(self, 'canvas'):
-            self.canvas.before.clear()
-            with self.canvas.before:
-                if value:
-                    Color(*StyledButton.hex2rgba(PACIFICA_BLUE, 0.3))  # light blue background
-                else:
-                    Color(*StyledButton.hex2rgba("#FFFFFF", 1.0))  # white background
-                Rectangle(pos=self.pos, size=self.size)
-    
+        self._bg_color.rgba = PACIFICA_BLUE_SEL if value else WHITE_RGBA  # light blue / white
+
     def on_checkbox_toggle(self, checkbox, value):
         """Handle checkbox toggle"""
+        if value == self.selected:
+            # Echo of on_selected_change while the view is being refreshed
+            return
         self.selected = value
-        
-        # Update the RecycleView data
-        # Find the RecycleView by walking up the parent tree
-        rv = self.parent
-        while rv and not hasattr(rv, 'data'):
-            rv = rv.parent
-            
-        if rv and hasattr(rv, 'data') and self.index is not None and self.index < len(rv.data):
-            rv.data[self.index]["selected"] = value
-            
-            if hasattr(rv, 'app'):
-                if value:
-                    rv.app.mark_selected(self.index)
-                else:
-                    rv.app.mark_deselected(self.index)
+
+        # Record it in the app's selection mask via the rv stored by refresh_view_attrs
+        rv = self.rv
+        if rv is not None and self.index is not None and self.index < len(rv.data):
+            if value:
+                rv.app.mark_selected(self.index)
+            else:
+                rv.app.mark_deselected(self.index)
 
     def on_touch_down(self, touch):
         if super().on_touch_down(touch):
             return True
         if self.collide_point(*touch.pos) and self.selectable:
-            # Toggle selection when clicked (but not on checkbox)
+            # Toggle selection when clicked anywhere on the row (but not on checkbox)
             if not self.checkbox.collide_point(*touch.pos):
                 self.checkbox.active = not self.checkbox.active
             return True
         return False
-    
+
     def on_size(self, *args):
         """Update background rectangle when size changes"""
-        self.on_selected_change(self, self.selected)
+        self._bg_rect.size = self.size
+
+    def on_pos(self, *args):
+        """Update background rectangle when position changes"""
+        self._bg_rect.pos = self.pos
 
 
 # --------------------------------------------------------------------------------------
@@ -920,10 +1372,21 @@ class PacificaAgendaApp(App):
     gui_scale_factor = NumericProperty(1.0)
     backend: AgendaBackend
     screen_manager: ScreenManager = ObjectProperty(None)
-    spreadsheet_data: pd.DataFrame | None = None
-    filtered_items: List[pd.Series] = []
-    selected_indices: set[int] = set()
+    # Agenda item rows of the loaded sheet. The full sheet is not kept: only
+    # these rows are ever read, and boolean indexing already copied them out.
+    filtered_df: pd.DataFrame | None = None
+    _sheet_load_id: int = 0  # bumped per load so stale loader threads are ignored
+    _review_feed: tuple = ((), 0)  # (rows still to show, next index), see _feed_review_rows
+    # Set while _rebuild_ui runs its steps; a sheet finishing meanwhile is
+    # parked in _deferred_sheet and shown by _finish_rebuild_ui
+    _rebuilding: bool = False
+    _deferred_sheet: tuple | None = None
+    # One bool per filtered item; _selected_count mirrors selection_mask.sum()
+    selection_mask: np.ndarray | None = None
+    _selected_count: int = 0
     generation_cancel_event = threading.Event()
+    _done_sound = None  # completion sound, preloaded in on_start
+    _notification_icon = ""  # app_icon for plyer, resolved in on_start
 
     auto_scroll_gen = BooleanProperty(True)
     auto_scroll_debug = BooleanProperty(True)
@@ -943,6 +1406,21 @@ class PacificaAgendaApp(App):
     gen_output_container: BoxLayout | None = None  # Reference to the main output container
     debug_container: BoxLayout | None = None       # Reference to the debug console's container
 
+    _last_saved_conf: bytes = b""   # Serialised CONF as last written to disk
+    _help_text_cache: tuple = (None, "")   # (scale/header key, help markup)
+
+    # Kivy file chooser used when no native dialog is available; built once
+    _fallback_chooser_popup: Popup | None = None
+    _fallback_chooser_target: tuple = ("", None)   # (filetype, callback) of the open request
+    _save_chooser_popup: Popup | None = None
+    _save_chooser_target: tuple = (None, "")  # (doc, suggested_name) of the save request
+
+    # Header / prompt editor popups, built on first use and then reused
+    _header_editor: tuple | None = None        # (popup, title label, text input)
+    _header_editor_target: tuple = ("", "")    # (header key, display title)
+    _prompt_editor: tuple | None = None        # (popup, text input)
+    _prompt_editor_target: str = ""            # "pass1" or "pass2"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Config persistence
@@ -959,6 +1437,11 @@ class PacificaAgendaApp(App):
             self.CONF.get("spreadsheet_headers") or DEFAULT_SPREADSHEET_HEADERS.copy()
         )
 
+    def on_gui_scale_factor(self, _instance, value):
+        """Keep the module-level SCALE in sync for widget constructors."""
+        global SCALE
+        SCALE = value
+
     def _load_conf(self) -> dict:
         default_conf = {
             "current_model": "",
@@ -970,26 +1453,35 @@ class PacificaAgendaApp(App):
             "gui_scale": 1.0,
         }
         try:
-            with open(self.config_file, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
-                # Ensure new keys exist for older configs
-                if "spreadsheet_headers" not in data:
-                    data["spreadsheet_headers"] = DEFAULT_SPREADSHEET_HEADERS.copy()
-                if "ignore_brackets" not in data:
-                    data["ignore_brackets"] = False
-                if "gui_scale" not in data:
-                    data["gui_scale"] = 1.0
-                default_conf.update(data)
+            with open(self.config_file, "rb") as fp:
+                raw = fp.read()
+            data = _conf_loads(raw)
+            # Ensure new keys exist for older configs
+            if "spreadsheet_headers" not in data:
+                data["spreadsheet_headers"] = DEFAULT_SPREADSHEET_HEADERS.copy()
+            if "ignore_brackets" not in data:
+                data["ignore_brackets"] = False
+            if "gui_scale" not in data:
+                data["gui_scale"] = 1.0
+            default_conf.update(data)
+            # Remember the file's bytes so a save requested while the config
+            # is still unchanged since it was loaded is skipped
+            self._last_saved_conf = raw
         except Exception:
             # On first run or error, populate with defaults
             default_conf["spreadsheet_headers"] = DEFAULT_SPREADSHEET_HEADERS.copy()
         return default_conf
 
-    def _save_conf(self):
+    def _save_conf(self, *_):
         self.CONF["gui_scale"] = self.gui_scale_factor
         try:
-            with open(self.config_file, "w", encoding="utf-8") as fp:
-                json.dump(self.CONF, fp, indent=2)
+            data = _conf_dumps(self.CONF)
+            if data == self._last_saved_conf:
+                # Unchanged since the last write
+                return
+            with open(self.config_file, "wb") as fp:
+                fp.write(data)
+            self._last_saved_conf = data
         except Exception as e:
             # Inform the user rather than failing silently
             self._show_error(
@@ -998,6 +1490,10 @@ class PacificaAgendaApp(App):
                 f"This means recent changes may not persist.\n\nDetails: {e}"
             )
 
+    def _schedule_save_conf(self):
+        """Save the config shortly, coalescing changes made in quick succession."""
+        self._save_conf_trigger()
+
     def build(self):
         Window.clearcolor = StyledButton.hex2rgba(PACIFICA_SAND, 1)
         
@@ -1006,15 +1502,36 @@ class PacificaAgendaApp(App):
         )
 
         self.screen_manager = ScreenManager(transition=SlideTransition(duration=0.25))
+        # Cached button hover bounds go stale when screens slide or the window resizes
+        self.screen_manager.transition.bind(on_complete=_bump_hover_epoch)
+        Window.bind(size=_bump_hover_epoch)
+        # Secondary screens are built on first visit to keep startup fast
+        self._lazy_screens = {
+            "settings": self._build_settings,
+            "help": self._build_help,
+            "credits": self._build_credits,
+            "model_install": self._build_model_install,
+        }
+        # Checkbox toggles can arrive in bursts, so refresh the count once per frame
+        self._selected_label_trigger = Clock.create_trigger(self._update_selected_label, 0)
+        # Hands a freshly loaded sheet to the review list one chunk per frame
+        self._review_feed_trigger = Clock.create_trigger(self._feed_review_rows, 0)
+        # Settings toggles and editors save through this so rapid changes
+        # collapse into a single write (see _schedule_save_conf)
+        self._save_conf_trigger = Clock.create_trigger(self._save_conf, 0.3)
+        # Streamed text (report tokens and debug output) is queued by the
+        # generation thread and drained once per frame on the main thread
+        self._stream_lock = threading.Lock()
+        self._pending_gen_text: List[str] = []
+        self._pending_debug_text: List[str] = []
+        self._gen_flush_trigger = Clock.create_trigger(self._flush_gen_text, 0)
+        # Output text of the current run, owned here so it survives a rescale
+        self._gen_text = ""
         self._build_home()
         self._build_review()
         self._build_generation()
-        self._build_settings()
-        self._build_help()
-        self._build_credits()
-        self._build_model_install()
 
-        # Set initial model status in settings UI
+        # Set initial model status
         self._update_model_status()
 
         # Set initial debug console visibility based on loaded config
@@ -1042,8 +1559,60 @@ class PacificaAgendaApp(App):
         except Exception as e:
             print(f"could not center window: {e}")
 
-    def _navigate_to(self, screen_name: str):
+        # Decode the completion sound now so playing it later is instant
+        self._done_sound = self._load_notification_sound()
+        # .ico for Windows, .png for macOS/Linux (plyer handles this)
+        if platform == "win" and os.path.exists("logo.ico"):
+            self._notification_icon = "logo.ico"
+        elif os.path.exists("logo.png"):
+            self._notification_icon = "logo.png"
+
+        if platform == "macosx":
+            # Start the dialog helper now so the first file dialog opens quickly
+            try:
+                _dialog_helper.start()
+            except Exception as e:
+                print(f"could not start dialog helper: {e}")
+
+    def on_stop(self):
+        # Flush a config write that is still waiting on its debounce delay
+        if self._save_conf_trigger.is_triggered:
+            self._save_conf_trigger.cancel()
+            self._save_conf()
+        _dialog_helper.stop()
+
+    @staticmethod
+    def _load_notification_sound():
+        """Load the completion sound, or return None if it is unavailable."""
+        try:
+            # NOTE: Requires 'notification.wav' or 'notification.mp3' in the root directory.
+            sound = SoundLoader.load('notification.wav')
+            if not sound:
+                sound = SoundLoader.load('notification.mp3')  # Fallback to mp3
+            if sound:
+                sound.load()
+            return sound
+        except Exception as e:
+            print(f"Could not load notification sound: {e}", file=sys.stderr)
+            return None
+
+    def _ensure_screen(self, screen_name: str):
+        """build a lazily-created screen the first time it is needed"""
+        if screen_name in self.screen_manager.screen_names:
+            return
+        builder = self._lazy_screens.get(screen_name)
+        if builder is None:
+            return
+        builder()
+        # Bring the freshly built widgets up to date with current state
+        if screen_name == "settings":
+            self._update_model_status()
+        elif screen_name == "model_install":
+            self._refresh_models_dropdown()
+
+    def _navigate_to(self, screen_name: str, *_):
         """navigate to a screen with proper slide direction"""
+        self._ensure_screen(screen_name)
         current_screen = self.screen_manager.current
         
         # determine slide direction based on navigation flow
@@ -1089,13 +1658,13 @@ class PacificaAgendaApp(App):
             text="[b]City of Pacifica[/b]\nAgenda Summary Generator",
             markup=True,
             font_size=36 * scale,
-            color=[0, 0, 0, 1],
+            color=BLACK_RGBA,
             size_hint=(2, None),
             height=180 * scale,
         )
         header.halign = "center"
         header.valign = "middle"
-        header.bind(width=lambda inst, w: inst.setter("text_size")(inst, (w, None)))
+        header.bind(width=_sync_text_size)
         logo_header.add_widget(header)
         logo_header.add_widget(Widget(size_hint_x=1))  # add spacer to center content
         root.add_widget(logo_header)
@@ -1108,15 +1677,15 @@ class PacificaAgendaApp(App):
         nav_bar.add_widget(Widget())
 
         settings_btn = StyledButton(text="Settings", size_hint=(None, None), width=220, height=75)
-        settings_btn.bind(on_release=lambda *_: self._navigate_to("settings"))
+        settings_btn.fbind('on_release', self._navigate_to, "settings")
         nav_bar.add_widget(settings_btn)
 
         help_btn = StyledButton(text="Help", size_hint=(None, None), width=220, height=75)
-        help_btn.bind(on_release=lambda *_: self._navigate_to("help"))
+        help_btn.fbind('on_release', self._navigate_to, "help")
         nav_bar.add_widget(help_btn)
 
         credits_btn = StyledButton(text="Credits", size_hint=(None, None), width=220, height=75)
-        credits_btn.bind(on_release=lambda *_: self._navigate_to("credits"))
+        credits_btn.fbind('on_release', self._navigate_to, "credits")
         nav_bar.add_widget(credits_btn)
 
         nav_bar.add_widget(Widget())
@@ -1163,21 +1732,31 @@ class PacificaAgendaApp(App):
             filters = [("All files", "*.*")]
             title = "Select File"
         
-        selection = native_open_file_dialog(title=title, file_types=filters)
+        run_native_dialog(
+            native_open_file_dialog,
+            lambda selection: self._on_native_file_selected(filetype, selection),
+            title=title,
+            file_types=filters
+        )
+
+    def _on_native_file_selected(self, filetype: str, selection):
         # If native dialog was used, selection will be a list (empty on cancel).
         # If native dialog is not supported/failed, it will be None.
-        if selection is not None:
-            if selection:  # If list is not empty (file was selected)
-                path = selection[0]
-                if filetype == "xlsx":
-                    if not path.lower().endswith(".xlsx"):
-                        self._show_error("Invalid File Type", "Please select a Microsoft Excel .xlsx file.")
-                        return
-                    self._process_spreadsheet_file(path)
-                elif filetype == "gguf":
-                    self._handle_gguf_file(path)
-            return  # Return here to prevent Kivy fallback
-        
+        if selection is None:
+            self._open_kivy_file_chooser(filetype)
+            return
+
+        if selection:  # If list is not empty (file was selected)
+            path = selection[0]
+            if filetype == "xlsx":
+                if not path.lower().endswith(".xlsx"):
+                    self._show_error("Invalid File Type", "Please select a Microsoft Excel .xlsx file.")
+                    return
+                self._process_spreadsheet_file(path)
+            elif filetype == "gguf":
+                self._handle_gguf_file(path)
+
+    def _open_kivy_file_chooser(self, filetype: str):
         # fallback to kivy file chooser
         if filetype == "xlsx":
             # On macOS, allow all files and post-validate like native. Else, filter to .xlsx for convenience.
@@ -1193,22 +1772,33 @@ class PacificaAgendaApp(App):
             popup_title = "Select File"
             callback = lambda _: None # No-op for unknown types
 
-        chooser = FileChooserListView(filters=kivy_filters, path=os.getcwd())
-        popup = Popup(title=popup_title, content=chooser, size_hint=(0.9, 0.9))
-
-        def _file_chosen(instance, selection, touch):
-            if selection:
-                path = selection[0]
-                if filetype == "xlsx" and not path.lower().endswith(".xlsx"):
-                    # Keep popup open; inform user of invalid selection
-                    self._show_error("Invalid File Type", "Please select a Microsoft Excel .xlsx file.")
-                    return
-                popup.dismiss()
-                callback(path)
-
-        chooser.bind(on_submit=_file_chosen)
+        # Reuse the same chooser and popup; only the filters, title and
+        # starting folder change between requests
+        popup = self._fallback_chooser_popup
+        if popup is None:
+            chooser = FileChooserListView()
+            chooser.bind(on_submit=self._on_fallback_file_chosen)
+            popup = Popup(content=chooser, size_hint=(0.9, 0.9))
+            self._fallback_chooser_popup = popup
+        chooser = popup.content
+        chooser.filters = kivy_filters or []
+        chooser.path = os.getcwd()
+        chooser.selection = []
+        popup.title = popup_title
+        self._fallback_chooser_target = (filetype, callback)
         popup.open()
 
+    def _on_fallback_file_chosen(self, _chooser, selection, _touch):
+        if selection:
+            path = selection[0]
+            filetype, callback = self._fallback_chooser_target
+            if filetype == "xlsx" and not path.lower().endswith(".xlsx"):
+                # Keep popup open; inform user of invalid selection
+                self._show_error("Invalid File Type", "Please select a Microsoft Excel .xlsx file.")
+                return
+            self._fallback_chooser_popup.dismiss()
+            callback(path)
+
     def _on_file_drop(self, _window, file_path_bytes):
         path = file_path_bytes.decode("utf-8")
         current_screen = self.screen_manager.current
@@ -1221,15 +1811,25 @@ class PacificaAgendaApp(App):
     def _process_spreadsheet_file(self, filepath: str):
         """Process an Excel file by first allowing user to select a sheet.
 
+        Opening the workbook to list its sheets can take a while for big
+        files, so it runs on a worker thread (see _sheet_names_worker).
+        """
+        threading.Thread(target=self._sheet_names_worker, args=(filepath,), daemon=True).start()
+
+    def _sheet_names_worker(self, filepath: str):
+        """Worker thread: list the workbook's sheets and hand them to the UI.
+
         Uses a context-managed ExcelFile to ensure handles are closed promptly.
         Retries once after a short delay if Windows intermittently throws
         'ValueError: I/O operation on closed file'.
         """
+        import pandas as pd
+
         try:
             # Helper wrapped in a context-manager so the underlying file handle
             # is deterministically released as soon as we're done.
             def _get_sheet_names():
-                with pd.ExcelFile(filepath) as excel_file:
+                with pd.ExcelFile(filepath, engine=EXCEL_ENGINE) as excel_file:
                     return excel_file.sheet_names
 
             try:
@@ -1246,16 +1846,19 @@ class PacificaAgendaApp(App):
                 self._show_error("Excel Error", "The Excel file contains no sheets.")
                 return
 
-            # If only one sheet, process it directly
-            if len(sheet_names) == 1:
-                self._load_and_process_sheet(filepath, sheet_names[0])
-            else:
-                # Show sheet selection popup
-                self._show_sheet_selection_popup(filepath, sheet_names)
+            self._on_sheet_names(filepath, sheet_names)
 
         except Exception as exc:
             self._show_error("Excel Error", f"Failed to read Excel file: {str(exc)}")
-            return
+
+    @mainthread
+    def _on_sheet_names(self, filepath: str, sheet_names: List[str]):
+        # If only one sheet, process it directly
+        if len(sheet_names) == 1:
+            self._load_and_process_sheet(filepath, sheet_names[0])
+        else:
+            # Show sheet selection popup
+            self._show_sheet_selection_popup(filepath, sheet_names)
 
     def _show_sheet_selection_popup(self, filepath: str, sheet_names: List[str]):
         """Display a popup with a scrollable, clickable list of sheets. Selected row is blue-highlighted."""
@@ -1269,7 +1872,7 @@ class PacificaAgendaApp(App):
             size_hint_y=None,
             height=40 * scale,
             font_size=24 * scale,
-            color=[1, 1, 1, 1]
+            color=WHITE_RGBA
         )
         content.add_widget(label)
 
@@ -1283,7 +1886,7 @@ class PacificaAgendaApp(App):
 
         # Add white background to list_container to fill empty space
         with list_container.canvas.before:
-            Color(1, 1, 1, 1)
+            Color(*WHITE_RGBA)
             self.list_rect = Rectangle(pos=list_container.pos, size=list_container.size)
         def update_rect(instance, value):
             self.list_rect.pos = instance.pos
@@ -1303,11 +1906,11 @@ class PacificaAgendaApp(App):
                 if i == selected_index[0]:
                     btn.background_normal = ""
                     btn.background_color = StyledButton.hex2rgba(PACIFICA_BLUE, 1.0)
-                    btn.color = [1, 1, 1, 1]
+                    btn.color = WHITE_RGBA
                 else:
                     btn.background_normal = ""
-                    btn.background_color = [1, 1, 1, 1]
-                    btn.color = [0, 0, 0, 1]
+                    btn.background_color = WHITE_RGBA
+                    btn.color = BLACK_RGBA
 
         # Create a button for each sheet
         for idx, name in enumerate(sheet_names):
@@ -1317,8 +1920,8 @@ class PacificaAgendaApp(App):
                 height=row_height,
                 font_size=26 * scale,
                 background_normal="",
-                background_color=[1, 1, 1, 1],
-                color=[0, 0, 0, 1],
+                background_color=WHITE_RGBA,
+                color=BLACK_RGBA,
                 halign="left",
                 valign="middle"
             )
@@ -1368,12 +1971,27 @@ class PacificaAgendaApp(App):
     def _load_and_process_sheet(self, filepath: str, sheet_name: str):
         """Load the selected sheet and process it through the backend.
 
+        Reading and row preparation run on a worker thread; rows are handed
+        to the review list in chunks so the UI stays responsive on big sheets.
+        """
+        self._sheet_load_id += 1
+        threading.Thread(
+            target=self._sheet_worker,
+            args=(filepath, sheet_name, self._sheet_load_id),
+            daemon=True,
+        ).start()
+
+    def _sheet_worker(self, filepath: str, sheet_name: str, load_id: int):
+        """Worker thread: read the sheet and stream review rows to the UI.
+
         Wraps `pd.read_excel` in a retry to mitigate transient Windows file-locking.
         """
+        import pandas as pd
+
         try:
             # Read the specific sheet into a DataFrame with retry.
             def _read_df():
-                return pd.read_excel(filepath, sheet_name=sheet_name)
+                return pd.read_excel(filepath, sheet_name=sheet_name, engine=EXCEL_ENGINE)
 
             try:
                 df = _read_df()
@@ -1385,17 +2003,53 @@ class PacificaAgendaApp(App):
                     raise
 
             # Process through the backend
-            self.spreadsheet_data, self.filtered_items = self.backend.process_spreadsheet_data(
+            # Only the agenda item rows are kept; dropping df frees the full sheet
+            filtered_df = self.backend.process_spreadsheet_data(
                 df, self.spreadsheet_headers
-            )
-
-            # Navigate to review screen
-            self._populate_review_list()
-            self._navigate_to("review")
+            )[1]
+            del df
+            ignore_brackets = self.CONF.get("ignore_brackets", False)
+            rows, include = self._make_review_rows(filtered_df, ignore_brackets)
+            self._on_sheet_loaded(filtered_df, include, rows, load_id)
 
         except Exception as exc:
             self._show_error("Processing Error", str(exc))
 
+    @mainthread
+    def _on_sheet_loaded(self, filtered_df, include: np.ndarray, rows: List[dict], load_id: int):
+        """Store the parsed sheet and its initial selection, show the review
+        screen and start feeding its rows in."""
+        if load_id != self._sheet_load_id:
+            return  # a newer file was opened meanwhile
+        if self._rebuilding:
+            # review_rv is about to be replaced; show the sheet once it is
+            self._deferred_sheet = (filtered_df, include, rows, load_id)
+            return
+        self.filtered_df = filtered_df
+        self.selection_mask = include
+        self._selected_count = int(include.sum())
+        self.review_rv.data = []
+        self.review_label.text = "Loading items..."
+        self._review_feed = (rows, 0)
+        self._review_feed_trigger()
+
+        # Navigate to review screen
+        self._navigate_to("review")
+
+    def _feed_review_rows(self, *_):
+        """Append the next REVIEW_CHUNK_ROWS rows, then come back next frame
+        until the whole sheet is shown."""
+        rows, start = self._review_feed
+        end = start + REVIEW_CHUNK_ROWS
+        self.review_rv.data.extend(rows[start:end])
+        if end < len(rows):
+            self._review_feed = (rows, end)
+            self.review_label.text = f"Loaded {end} of {len(rows)} rows..."
+            self._review_feed_trigger()
+        else:
+            self._review_feed = ((), 0)
+            self._update_selected_label()
+
     # ---------------------------------------------------------------- Review screen
     def _build_review(self):
         scale = self.gui_scale_factor
@@ -1405,10 +2059,10 @@ class PacificaAgendaApp(App):
 
         topbar = BoxLayout(orientation="horizontal", size_hint_y=None, height=75 * scale, spacing=10 * scale)
         back_btn = StyledButton(text="Back", size_hint=(None, None), width=180, height=75)
-        back_btn.bind(on_release=lambda *_: self._navigate_to("home"))
+        back_btn.fbind('on_release', self._navigate_to, "home")
         topbar.add_widget(back_btn)
 
-        self.review_label = Label(text="Items Selected: 0", color=[0, 0, 0, 1], font_size=50 * scale)
+        self.review_label = Label(text="Items Selected: 0", color=BLACK_RGBA, font_size=50 * scale)
         topbar.add_widget(self.review_label)
 
         gen_btn = StyledButton(text="Generate", size_hint=(None, None), width=240, height=75)
@@ -1423,19 +2077,19 @@ class PacificaAgendaApp(App):
             orientation="horizontal",
             size_hint_y=None,
             height=50 * scale,
-            padding=(20 * scale, 15 * scale), # Match AgendaItem's outer padding
-            spacing=15 * scale # Match AgendaItem's outer spacing
+            padding=(20 * scale, 15 * scale), # Match SelectableItem's outer padding
+            spacing=15 * scale # Match SelectableItem's outer spacing
         )
         with header_container.canvas.before:
-            Color(*StyledButton.hex2rgba(PACIFICA_BLUE, 0.2)) # Light blue header background
-            Rectangle(pos=header_container.pos, size=header_container.size)
-        header_container.bind(pos=lambda inst, val: setattr(inst.canvas.before.children[-1], 'pos', val),
-                              size=lambda inst, val: setattr(inst.canvas.before.children[-1], 'size', val))
+            Color(*PACIFICA_BLUE_HDR) # Light blue header background
+            hdr_rect = Rectangle(pos=header_container.pos, size=header_container.size)
+        header_container.bind(pos=lambda inst, val: setattr(hdr_rect, 'pos', val),
+                              size=lambda inst, val: setattr(hdr_rect, 'size', val))
 
         # Placeholder for checkbox column
         header_container.add_widget(Widget(size_hint_x=None, width=40 * scale))
 
-        # Container for header labels to match AgendaItem's internal structure
+        # Container for header labels to match SelectableItem's internal structure
         header_labels_container = BoxLayout(
             orientation="horizontal",
             size_hint_x=1,
@@ -1450,11 +2104,20 @@ class PacificaAgendaApp(App):
         layout.add_widget(header_container)
         header_container.add_widget(header_labels_container)
 
-        scroll = ScrollView(size_hint=(1, 1), scroll_distance=100, scroll_wheel_distance=150 * scale)
-        self.items_container = BoxLayout(orientation='vertical', size_hint_y=None, spacing=2)
-        self.items_container.bind(minimum_height=self.items_container.setter('height'))
-        scroll.add_widget(self.items_container)
-        layout.add_widget(scroll)
+        # Recycled list: only the rows in view are real widgets, the rest is data
+        self.review_rv = RecycleView(size_hint=(1, 1), scroll_distance=100, scroll_wheel_distance=150 * scale)
+        self.review_rv.viewclass = SelectableItem
+        self.review_rv.app = self
+        rv_layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, 50 * scale),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=2
+        )
+        rv_layout.bind(minimum_height=rv_layout.setter('height'))
+        self.review_rv.add_widget(rv_layout)
+        layout.add_widget(self.review_rv)
 
         sel_bar = BoxLayout(size_hint_y=None, height=75 * scale, spacing=10 * scale)
         sel_all = StyledButton(text="Select All", size_hint=(None, None), width=220, height=75)
@@ -1467,74 +2130,101 @@ class PacificaAgendaApp(App):
 
         self.screen_manager.add_widget(scr)
 
-    def _populate_review_list(self):
-        self.selected_indices.clear()
-        self.items_container.clear_widgets()
+    def _populate_review_list(self, rows: List[dict]):
+        """Fill the review list from already prepared row dicts.
 
-        for idx, row in enumerate(self.filtered_items):
-            # pre-select if Include column is 'y' or 'yes' (case-insensitive)
-            include_val = str(row.get(self.spreadsheet_headers["include"], "")).strip().lower()
-            include_flag = include_val in ("y", "yes")
-
-            # Extract individual column data
-            # Get the ignore_brackets setting
-            ignore_brackets = self.CONF.get("ignore_brackets", False)
+        Passing the previous list's rows keeps the user's selection; their
+        measured heights are dropped since the scale changed.
+        """
+        # Any rows still being fed in are superseded by this full list
+        self._review_feed_trigger.cancel()
+        self._review_feed = ((), 0)
+        for row in rows:
+            row.pop("height", None)
+        self.review_rv.data = rows
+        self._update_selected_label()
+
+    def _make_review_rows(self, frame: pd.DataFrame, ignore_brackets: bool) -> tuple[List[dict], np.ndarray]:
+        """Turn the filtered spreadsheet rows into review-list data dicts plus
+        the initial selection mask (the Include column).
+
+        Text cleanup runs as vectorised pandas string ops over whole columns
+        rather than per row. Pure data work with no widget access, so it is
+        safe to call from the sheet loading thread.
+        """
+        headers = self.spreadsheet_headers
+
+        def _clean(column: str) -> pd.Series:
+            # map(str) rather than astype(str): it turns NaN into "nan" on every
+            # pandas version, exactly like the str() calls this replaced
+            return (
+                frame[column].map(str)
+                .str.replace("\n", " ", regex=False)
+                .str.replace("•", "-", regex=False)
+                .str.strip()
+            )
 
-            date_text = self.backend.get_display_date(row.get(self.spreadsheet_headers["date"], ""))
-            section_text = str(row.get(self.spreadsheet_headers["section"], "")).replace("\n", " ").replace("•", "-").strip()
-            if section_text == "nan":
-                section_text = "placeholder" # Or suitable default/empty string
-            item_text = str(row.get(self.spreadsheet_headers["item"], "")).replace("\n", " ").replace("•", "-").strip()
-            if item_text == "nan":
-                item_text = "unnamed item" # Or suitable default/empty string
-            notes_text = ""
-            if pd.notna(row.get(self.spreadsheet_headers["notes"])):
-                n = str(row[self.spreadsheet_headers["notes"]]).replace("\n", " ").replace("•", "-").strip()
-                if n and n.lower() != "nan":
-                    notes_text = n
-            
-            # Conditionally strip brackets if setting is enabled
-            if ignore_brackets:
-                date_text = re.sub(r'\[.*?\]', '', date_text).strip()
-                section_text = re.sub(r'\[.*?\]', '', section_text).strip()
-                item_text = re.sub(r'\[.*?\]', '', item_text).strip()
-                notes_text = re.sub(r'\[.*?\]', '', notes_text).strip()
+        # pre-select if Include column is 'y' or 'yes' (case-insensitive)
+        include = frame[headers["include"]].map(str).str.strip().str.lower().isin(("y", "yes"))
+
+        # Extract individual column data
+        dates = frame[headers["date"]].map(self.backend.get_display_date)
+        sections = _clean(headers["section"])
+        sections = sections.mask(sections == "nan", "placeholder") # Or suitable default/empty string
+        items = _clean(headers["item"])
+        items = items.mask(items == "nan", "unnamed item") # Or suitable default/empty string
+        notes = _clean(headers["notes"])
+        notes = notes.where(frame[headers["notes"]].notna() & (notes.str.lower() != "nan"), "")
+
+        columns = [dates, sections, items, notes]
+        # Conditionally strip brackets if setting is enabled
+        if ignore_brackets:
+            columns = [col.str.replace(_BRACKET_RE, '', regex=True).str.strip() for col in columns]
+
+        # One plain dict per row; SelectableItem views are recycled over these
+        rows = [
+            {
+                "date": date_text,
+                "section": section_text,
+                "item": item_text,
+                "notes": notes_text,
+                "index": idx,
+            }
+            for idx, (date_text, section_text, item_text, notes_text) in enumerate(
+                zip(*(col.tolist() for col in columns))
+            )
+        ]
+        return rows, include.to_numpy(dtype=bool)
 
-            # Instantiate AgendaItem with individual column data
-            widget = AgendaItem(date_text, section_text, item_text, notes_text, idx, self)
-            widget.checkbox.active = include_flag
-            widget.selected = include_flag
+    def _select_all_items(self, select=True):
+        if self.selection_mask is None:
+            return
+        # Update selection tracking
+        self.selection_mask[:] = select
+        self._selected_count = len(self.selection_mask) if select else 0
 
-            self.items_container.add_widget(widget)
-            if include_flag:
-                self.selected_indices.add(idx)
+        # Rows read their state from the mask whenever they are rebound, so
+        # only the views currently on screen need updating
+        for view in self.review_rv.layout_manager.children:
+            view.selected = select
 
-        self.review_label.text = f"Items Selected: {len(self.selected_indices)}"
+        self._selected_label_trigger()
 
-    def _select_all_items(self, select=True):
-        # Update all item widgets
-        for child in self.items_container.children:
-            if isinstance(child, AgendaItem):
-                child.checkbox.active = select
-                child.selected = select
-                child.update_background()
-        
-        # Update selection tracking
-        if select:
-            self.selected_indices = set(range(len(self.items_container.children)))
-        else:
-            self.selected_indices.clear()
-        
-        self.review_label.text = f"Items Selected: {len(self.selected_indices)}"
+    def _update_selected_label(self, *_):
+        self.review_label.text = f"Items Selected: {self._selected_count}"
 
     # called from child item views
     def mark_selected(self, index: int):
-        self.selected_indices.add(index)
-        self.review_label.text = f"Items Selected: {len(self.selected_indices)}"
+        if not self.selection_mask[index]:
+            self.selection_mask[index] = True
+            self._selected_count += 1
+        self._selected_label_trigger()
 
     def mark_deselected(self, index: int):
-        self.selected_indices.discard(index)
-        self.review_label.text = f"Items Selected: {len(self.selected_indices)}"
+        if self.selection_mask[index]:
+            self.selection_mask[index] = False
+            self._selected_count -= 1
+        self._selected_label_trigger()
 
     # ---------------------------------------------------------------- Generation screen
     def _build_generation(self):
@@ -1573,16 +2263,19 @@ class PacificaAgendaApp(App):
         self.gen_output = TextInput(
             readonly=True,
             font_size=28 * scale,
-            foreground_color=[0, 0, 0, 1],
-            background_color=[1, 1, 1, 1],
+            foreground_color=BLACK_RGBA,
+            background_color=WHITE_RGBA,
             size_hint_y=None,
+            text=self._gen_text,
         )
         self.gen_output.bind(minimum_height=self.gen_output.setter('height'))
 
         self.sv_gen_output = ScrollView(scroll_wheel_distance=50 * scale)
         self.sv_gen_output.add_widget(self.gen_output)
-        self.sv_gen_output.bind(on_scroll_stop=self._on_scroll_stop)
+        self.sv_gen_output.bind(on_scroll_stop=self._on_gen_scroll_stop)
         self.gen_output_container.add_widget(self.sv_gen_output)
+        # Auto-scroll requests arrive per token; triggers fold them into one per frame
+        self._gen_scroll_trigger = Clock.create_trigger(self._scroll_gen_to_end, -1)
 
         # --- Optional Debug Console Area ---
         # ALWAYS create debug console components, their visibility is controlled later
@@ -1610,10 +2303,14 @@ class PacificaAgendaApp(App):
             font_size=14 * scale
         )
         self.debug_console.bind(minimum_height=self.debug_console.setter('height'))
+        self._debug_lines = deque([""], maxlen=DEBUG_CONSOLE_MAX_LINES)
+        self._debug_flush_trigger = Clock.create_trigger(self._flush_debug_console, 0)
+        self._debug_scroll_trigger = Clock.create_trigger(self._scroll_debug_to_end, -1)
+        self._reset_debug_scroll = Clock.create_trigger(self._snap_debug_scroll, -1)
 
         self.sv_debug = ScrollView(scroll_wheel_distance=50 * scale)
         self.sv_debug.add_widget(self.debug_console)
-        self.sv_debug.bind(on_scroll_stop=self._on_scroll_stop)
+        self.sv_debug.bind(on_scroll_stop=self._on_debug_scroll_stop)
         self.debug_container.add_widget(self.sv_debug)
 
         # DO NOT add self.debug_container to self.generation_area here.
@@ -1636,6 +2333,8 @@ class PacificaAgendaApp(App):
             # If debug is on, add debug_container and set proportional heights
             if self.debug_container not in self.generation_area.children:
                 self.generation_area.add_widget(self.debug_container)
+                # Catch up on lines collected while the console was hidden
+                self.debug_console.text = "\n".join(self._debug_lines)
             self.gen_output_container.size_hint_y = 0.5
             self.debug_container.size_hint_y = 0.5
         else:
@@ -1647,8 +2346,7 @@ class PacificaAgendaApp(App):
 
         # Schedule a layout update to ensure changes are applied immediately
         # (A small delay can sometimes help Kivy's layout engine react better)
-        from kivy.clock import Clock
-        Clock.schedule_once(lambda dt: self.generation_area.do_layout(), 0)
+        Clock.schedule_once(self.generation_area.do_layout, 0)
 
     # ---------------------------------------------------------------- Settings
     def _build_settings(self):
@@ -1657,38 +2355,42 @@ class PacificaAgendaApp(App):
         root = BoxLayout(orientation="vertical", padding=20 * scale, spacing=20 * scale)
         scr.add_widget(root)
 
-        title = Label(text="[b]Settings[/b]", markup=True, font_size=48 * scale, size_hint_y=None, height=80 * scale, color=[0, 0, 0, 1])
+        title = Label(text="[b]Settings[/b]", markup=True, font_size=48 * scale, size_hint_y=None, height=80 * scale, color=BLACK_RGBA)
         root.add_widget(title)
 
-        grid = GridLayout(cols=2, rows=6, row_force_default=True, row_default_height=75 * scale, spacing=(10 * scale,10 * scale), size_hint_y=None)
+        # Shared by every settings row
+        row_font = 28 * scale
+        row_spacing = 10 * scale
+
+        grid = GridLayout(cols=2, rows=6, row_force_default=True, row_default_height=75 * scale, spacing=(row_spacing, row_spacing), size_hint_y=None)
         grid.bind(minimum_height=grid.setter('height'))
 
         # Model row
         label_model = Label(
             text="Model",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_model.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_model.bind(size=_sync_text_size)
         self.model_status_lbl = Label(
             text="Checking...",
-            color=[0, 0, 0, 1],
+            color=BLACK_RGBA,
             halign='left',
-            font_size=28 * scale
+            font_size=row_font
         )
-        self.model_status_lbl.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        self.model_status_lbl.bind(size=_sync_text_size)
         self.install_model_btn = StyledButton(
             text="Model Settings",
             size_hint=(None, None),
             width=280,
             height=75
         )
-        self.install_model_btn.bind(on_release=lambda *_: self._open_model_install_menu())
-        control_model = BoxLayout(orientation="horizontal", spacing=10 * scale, size_hint_x=0.7)
+        self.install_model_btn.fbind('on_release', self._open_model_install_menu)
+        control_model = BoxLayout(orientation="horizontal", spacing=row_spacing, size_hint_x=0.7)
         control_model.add_widget(self.model_status_lbl)
         control_model.add_widget(self.install_model_btn)
         grid.add_widget(label_model)
@@ -1697,19 +2399,19 @@ class PacificaAgendaApp(App):
         # Prompt Templates row
         label_prompts = Label(
             text="Prompt Templates",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_prompts.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_prompts.bind(size=_sync_text_size)
         edit_p1_btn = StyledButton(text="Edit Pass 1 Prompt", size_hint_x=None, width=300)
         edit_p1_btn.bind(on_release=lambda *_: self._open_prompt_editor("pass1"))
         edit_p2_btn = StyledButton(text="Edit Pass 2 Prompt", size_hint_x=None, width=300)
         edit_p2_btn.bind(on_release=lambda *_: self._open_prompt_editor("pass2"))
-        control_prompts = BoxLayout(orientation="horizontal", spacing=10 * scale, size_hint_x=0.7)
+        control_prompts = BoxLayout(orientation="horizontal", spacing=row_spacing, size_hint_x=0.7)
         control_prompts.add_widget(edit_p1_btn)
         control_prompts.add_widget(edit_p2_btn)
         grid.add_widget(label_prompts)
@@ -1718,14 +2420,14 @@ class PacificaAgendaApp(App):
         # Spreadsheet Headers row
         label_headers = Label(
             text="Spreadsheet Column Required Header Names",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_headers.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_headers.bind(size=_sync_text_size)
         
         control_headers = BoxLayout(orientation="horizontal", spacing=5 * scale, size_hint_x=0.7)
         
@@ -1749,14 +2451,14 @@ class PacificaAgendaApp(App):
         # Debug Mode row
         label_debug = Label(
             text="Debug Mode",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_debug.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_debug.bind(size=_sync_text_size)
         debug_toggle_btn = TogglableStyledButton(
             initial_active=self.CONF["debug"],
             callback=self._toggle_debug,
@@ -1764,7 +2466,7 @@ class PacificaAgendaApp(App):
             width=320,
             height=75
         )
-        control_debug = BoxLayout(orientation="horizontal", spacing=10 * scale, size_hint_x=0.7)
+        control_debug = BoxLayout(orientation="horizontal", spacing=row_spacing, size_hint_x=0.7)
         control_debug.add_widget(debug_toggle_btn)
         control_debug.add_widget(Widget()) # Add a spacer to push button to left if control_debug takes more space
         grid.add_widget(label_debug)
@@ -1773,14 +2475,14 @@ class PacificaAgendaApp(App):
         # Ignore Brackets row
         label_brackets = Label(
             text="Ignore Bracketed Text []",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_brackets.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_brackets.bind(size=_sync_text_size)
         brackets_toggle_btn = TogglableStyledButton(
             initial_active=self.CONF.get("ignore_brackets", False),
             callback=self._toggle_ignore_brackets,
@@ -1790,7 +2492,7 @@ class PacificaAgendaApp(App):
             text_on="Ignoring Brackets",
             text_off="Not Ignoring Brackets"
         )
-        control_brackets = BoxLayout(orientation="horizontal", spacing=10 * scale, size_hint_x=0.7)
+        control_brackets = BoxLayout(orientation="horizontal", spacing=row_spacing, size_hint_x=0.7)
         control_brackets.add_widget(brackets_toggle_btn)
         control_brackets.add_widget(Widget())
         grid.add_widget(label_brackets)
@@ -1799,14 +2501,14 @@ class PacificaAgendaApp(App):
         # GUI Scale row
         label_scale = Label(
             text="GUI Scale Factor",
-            color=[0, 0, 0, 1],
-            font_size=28 * scale,
+            color=BLACK_RGBA,
+            font_size=row_font,
             bold=True,
             halign='left',
             valign='middle',
             size_hint_x=0.3
         )
-        label_scale.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        label_scale.bind(size=_sync_text_size)
         
         self.scale_input = TextInput(
             text=str(self.gui_scale_factor),
@@ -1814,16 +2516,9 @@ class PacificaAgendaApp(App):
             width=100 * scale,
             height=50 * scale,
             font_size=24 * scale,
-            multiline=False
-        )
-
-        # Create a wrapper layout to center the TextInput
-        scale_input_wrapper = RelativeLayout(
-            size_hint=(None, 1), # Take full height of the row, use fixed width
-            width=self.scale_input.width
+            multiline=False,
+            pos_hint={'center_y': 0.5}  # BoxLayout honours center_y, so no wrapper is needed
         )
-        self.scale_input.pos_hint = {'center_y': 0.5}
-        scale_input_wrapper.add_widget(self.scale_input)
         
         set_scale_btn = StyledButton(
             text="Set Scale",
@@ -1831,7 +2526,7 @@ class PacificaAgendaApp(App):
             width=180,
             height=75
         )
-        set_scale_btn.bind(on_release=lambda *_: self._set_gui_scale())
+        set_scale_btn.fbind('on_release', self._set_gui_scale)
 
         reset_scale_btn = StyledButton(
             text="Reset",
@@ -1839,10 +2534,10 @@ class PacificaAgendaApp(App):
             width=180,
             height=75
         )
-        reset_scale_btn.bind(on_release=lambda *_: self._set_gui_scale(reset=True))
+        reset_scale_btn.fbind('on_release', partial(self._set_gui_scale, reset=True))
 
-        control_scale = BoxLayout(orientation="horizontal", spacing=10 * scale, size_hint_x=0.7)
-        control_scale.add_widget(scale_input_wrapper)
+        control_scale = BoxLayout(orientation="horizontal", spacing=row_spacing, size_hint_x=0.7)
+        control_scale.add_widget(self.scale_input)
         control_scale.add_widget(set_scale_btn)
         control_scale.add_widget(reset_scale_btn)
         control_scale.add_widget(Widget())
@@ -1857,7 +2552,7 @@ class PacificaAgendaApp(App):
     
         btn_bar = BoxLayout(size_hint_y=None, height=75 * scale, spacing=10 * scale)
         back_btn = StyledButton(text="Back", size_hint=(None, None), width=180, height=75)
-        back_btn.bind(on_release=lambda *_: self._navigate_to("home"))
+        back_btn.fbind('on_release', self._navigate_to, "home")
 
         uninstall_btn = StyledButton(
             text="Uninstall App",
@@ -1866,7 +2561,7 @@ class PacificaAgendaApp(App):
             height=75,
             bg_color_name_override="#D9534F"  # Red color for uninstall button
         )
-        uninstall_btn.bind(on_release=lambda *_: self._confirm_uninstall())
+        uninstall_btn.fbind('on_release', self._confirm_uninstall)
 
         btn_bar.add_widget(back_btn)
         btn_bar.add_widget(Widget())  # Spacer
@@ -1875,7 +2570,7 @@ class PacificaAgendaApp(App):
         root.add_widget(btn_bar)
         self.screen_manager.add_widget(scr)
 
-    def _set_gui_scale(self, reset=False):
+    def _set_gui_scale(self, *_, reset=False):
         if reset:
             new_scale = 1.0
         else:
@@ -1890,6 +2585,10 @@ class PacificaAgendaApp(App):
                 self._show_error("Invalid Scale", "Please enter a valid positive number for the scale factor (e.g., 1.0 or 1.2).")
                 return
 
+        if abs(new_scale - self.gui_scale_factor) < 1e-6:
+            # Same scale as now; nothing to rebuild
+            return
+
         self.gui_scale_factor = new_scale
         self._save_conf()
         self._rebuild_ui()
@@ -1898,34 +2597,74 @@ class PacificaAgendaApp(App):
         """
         Clears and rebuilds the entire UI to apply scaling changes.
         Preserves essential state like loaded spreadsheet data.
+
+        Each screen is built on its own frame behind a small progress popup,
+        so the window keeps repainting instead of freezing for the whole
+        rebuild; _finish_rebuild_ui restores state once the last one is done.
         """
         # Store current screen to return to it after rebuild
         current_screen = self.screen_manager.current
+        self._rebuilding = True
+        # The review rows are plain dicts, so they survive the rebuild as-is.
+        # A sheet still being fed in is taken whole from the pending feed.
+        pending_rows = self._review_feed[0]
+        review_rows = list(pending_rows or self.review_rv.data)
+        self._review_feed_trigger.cancel()
+        self._review_feed = ((), 0)
         
         # Clear all widgets from all screens, and the screen manager itself
         for screen in self.screen_manager.screens:
             screen.clear_widgets()
         self.screen_manager.clear_widgets()
 
-        # Re-build all screens with the new scale factor
-        self._build_home()
-        self._build_review()
-        self._build_generation()
-        self._build_settings()
-        self._build_help()
-        self._build_credits()
-        self._build_model_install() # Ensure ModelInstallScreen is rebuilt
-        
+        progress = Popup(
+            title="Rescaling",
+            content=Label(text="Applying the new GUI scale..."),
+            size_hint=(0.5, 0.3),
+            auto_dismiss=False,
+        )
+        progress.open()
+
+        # Re-build the core screens with the new scale factor; the others
+        # are rebuilt on their next visit
+        steps = iter((
+            self._build_home,
+            self._build_review,
+            self._build_generation,
+            partial(self._ensure_screen, current_screen),
+        ))
+
+        def run_next_step(_dt):
+            step = next(steps, None)
+            if step is None:
+                progress.dismiss()
+                self._finish_rebuild_ui(current_screen, review_rows)
+                return
+            step()
+            Clock.schedule_once(run_next_step, 0)
+
+        Clock.schedule_once(run_next_step, 0)
+
+    def _finish_rebuild_ui(self, current_screen: str, review_rows: List[dict]):
+        self._rebuilding = False
+        deferred_sheet, self._deferred_sheet = self._deferred_sheet, None
         # Restore necessary state
         self._update_model_status()
         self._update_debug_console_visibility(self.CONF["debug"])
         self._update_home_screen_ui()
-        if self.filtered_items:
-             self._populate_review_list()
+        if self.filtered_df is not None and deferred_sheet is None:
+             self._populate_review_list(review_rows)
         
-        # Return to the screen the user was on
-        self.screen_manager.current = "home" # Go home first to avoid visual glitches
+        # Return to the screen the user was on. Switch without animating so
+        # it happens in one step (the rebuilt manager starts on "home")
+        slide = self.screen_manager.transition
+        self.screen_manager.transition = NoTransition()
         self.screen_manager.current = current_screen
+        self.screen_manager.transition = slide
+        _bump_hover_epoch()
+        if deferred_sheet is not None:
+            # a sheet finished loading mid-rebuild; it replaces review_rows
+            self._on_sheet_loaded(*deferred_sheet)
         self._show_info("GUI Scale Updated", "UI has been rescaled.")
 
     # ---------------------------  Model Management ---------------------------
@@ -1942,14 +2681,13 @@ class PacificaAgendaApp(App):
         # Update labels etc.
         self._update_model_status()
         # Populate spinner after backend lists are ready
-        from kivy.clock import Clock
-        Clock.schedule_once(lambda dt: self._refresh_models_dropdown(), 0.1)
+        Clock.schedule_once(self._refresh_models_dropdown, 0.1)
 
-    def _refresh_models_dropdown(self):
+    def _refresh_models_dropdown(self, *_):
         """Refresh spinner values with the latest available models."""
-        if not hasattr(self, "model_spinner"):
+        if "model_install" not in self.screen_manager.screen_names:
             return
-        self.model_spinner.values = self.backend.get_available_models()
+        self.model_spinner.values = self.backend.get_available_models(refresh=True)
 
         # Ensure current value is still valid
         current = self.CONF.get("current_model", "")
@@ -1982,7 +2720,7 @@ class PacificaAgendaApp(App):
             # A model is selected, so revert to default spinner appearance
             spinner.background_normal = 'atlas://data/images/defaulttheme/spinner'
             spinner.background_down = 'atlas://data/images/defaulttheme/spinner_pressed'
-            spinner.background_color = (1, 1, 1, 1) # Reset tint
+            spinner.background_color = WHITE_RGBA # Reset tint
 
     def _on_model_selected(self, spinner, text):
         """User picked a model from the dropdown. This triggers a model load."""
@@ -1995,7 +2733,7 @@ class PacificaAgendaApp(App):
         try:
             self.backend.load_model_by_filename(text)
             self.CONF["current_model"] = text
-            self._save_conf()
+            self._schedule_save_conf()
             self._show_info(f"Model '{text}' selected and loading in background.")
             self._update_model_status()
         except Exception as e:
@@ -2018,7 +2756,7 @@ class PacificaAgendaApp(App):
         btns.add_widget(cancel); btns.add_widget(ok)
         content.add_widget(label); content.add_widget(btns)
         popup = Popup(title="Confirm Delete", content=content, size_hint=(0.7,0.4), auto_dismiss=False)
-        cancel.bind(on_release=lambda *_: popup.dismiss())
+        cancel.fbind('on_release', popup.dismiss)
         ok.bind(on_release=lambda *_: (popup.dismiss(), self._delete_model_file(fname)))
         popup.open()
 
@@ -2028,6 +2766,7 @@ class PacificaAgendaApp(App):
             path = os.path.join(self.backend._get_models_dir(), fname)
             if os.path.exists(path):
                 os.remove(path)
+            self.backend.invalidate_models_cache()
             # If deleted model was current, clear selection
             if self.CONF.get("current_model") == fname:
                 self.CONF["current_model"] = ""
@@ -2041,18 +2780,19 @@ class PacificaAgendaApp(App):
 
     @mainthread
     def _update_model_status(self):
-        current = self.CONF.get("current_model", "")
-        available = self.backend.get_available_models()
-        if current and current in available:
-            self.model_status_lbl.text = f"Current Model: {current}"
-        else:
-            if available:
-                self.model_status_lbl.text = "No model selected"
+        if "settings" in self.screen_manager.screen_names:
+            current = self.CONF.get("current_model", "")
+            available = self.backend.get_available_models()
+            if current and current in available:
+                self.model_status_lbl.text = f"Current Model: {current}"
             else:
-                self.model_status_lbl.text = "No models found – please install one"
-        # Button stays enabled & labelled as 'Model Settings'
-        self.install_model_btn.text = "Model Settings"
-        self.install_model_btn.disabled = False
+                if available:
+                    self.model_status_lbl.text = "No model selected"
+                else:
+                    self.model_status_lbl.text = "No models found – please install one"
+            # Button stays enabled & labelled as 'Model Settings'
+            self.install_model_btn.text = "Model Settings"
+            self.install_model_btn.disabled = False
         self._update_home_screen_ui()
 
     def _install_model(self):
@@ -2080,6 +2820,7 @@ class PacificaAgendaApp(App):
 
         def on_confirm(*_):
             popup.dismiss()
+            self._ensure_screen("settings")
             self.model_status_lbl.text = "Downloading... (may take a while)"
             # Button stays enabled for settings
             # Start download in a thread
@@ -2105,7 +2846,7 @@ class PacificaAgendaApp(App):
         """
         fname = os.path.basename(model_path)
         self.CONF["current_model"] = fname
-        self._save_conf()
+        self._schedule_save_conf()
 
         # Refresh dropdown / labels
         self._refresh_models_dropdown()
@@ -2126,19 +2867,30 @@ class PacificaAgendaApp(App):
 
     def _toggle_debug(self, value: bool):
         self.CONF["debug"] = value
-        self._save_conf()
+        self._schedule_save_conf()
         # Immediately update the debug console's visibility
         self._update_debug_console_visibility(value)
 
     def _toggle_ignore_brackets(self, value: bool):
         self.CONF["ignore_brackets"] = value
-        self._save_conf()
+        self._schedule_save_conf()
 
     def _open_header_editor(self, header_key: str, title_text: str):
+        # The editor popup is built once and reused; only its texts and the
+        # header it edits change between openings
+        if self._header_editor is None:
+            self._header_editor = self._build_header_editor()
+        popup, title_label, text_input = self._header_editor
+        self._header_editor_target = (header_key, title_text)
+        popup.title = f"Edit {title_text}"
+        title_label.text = f"Editing: {title_text}"
+        text_input.text = self.spreadsheet_headers.get(header_key, "")
+        popup.open()
+
+    def _build_header_editor(self) -> tuple:
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
         
         title_label = Label(
-            text=f"Editing: {title_text}",
             size_hint_y=None,
             height=40,
             font_size=24,
@@ -2153,11 +2905,10 @@ class PacificaAgendaApp(App):
             font_size=20,
             color=TEXT_COLOR
         )
-        info_label.bind(width=lambda inst, w: inst.setter("text_size")(inst, (w, None)))
+        info_label.bind(width=_sync_text_size)
         content.add_widget(info_label)
 
         text_input = TextInput(
-            text=self.spreadsheet_headers.get(header_key, ""),
             font_size=24,
             multiline=False,
             size_hint_y=None,
@@ -2176,48 +2927,55 @@ class PacificaAgendaApp(App):
         btn_layout.add_widget(save_btn)
         content.add_widget(btn_layout)
 
-        popup = Popup(title=f"Edit {title_text}", content=content, size_hint=(0.8, 0.6), auto_dismiss=False)
+        popup = Popup(content=content, size_hint=(0.8, 0.6), auto_dismiss=False)
 
-        def on_save(*_):
-            new_header = text_input.text.strip()
-            if not new_header:
-                self._show_error("Invalid Header", "Header name cannot be empty.")
-                return
-            self.spreadsheet_headers[header_key] = new_header
-            self.CONF["spreadsheet_headers"] = self.spreadsheet_headers
-            self._save_conf()
-            self._show_info(f"'{title_text}' header saved.")
-            popup.dismiss()
+        save_btn.fbind('on_release', self._on_header_editor_save)
+        reset_btn.fbind('on_release', self._on_header_editor_reset)
+        cancel_btn.fbind('on_release', popup.dismiss)
 
-        def on_reset(*_):
-            text_input.text = DEFAULT_SPREADSHEET_HEADERS[header_key]
+        return popup, title_label, text_input
 
-        def on_cancel(*_):
-            popup.dismiss()
-
-        save_btn.bind(on_release=on_save)
-        reset_btn.bind(on_release=on_reset)
-        cancel_btn.bind(on_release=on_cancel)
+    def _on_header_editor_save(self, *_):
+        popup, _title_label, text_input = self._header_editor
+        header_key, title_text = self._header_editor_target
+        new_header = text_input.text.strip()
+        if not new_header:
+            self._show_error("Invalid Header", "Header name cannot be empty.")
+            return
+        self.spreadsheet_headers[header_key] = new_header
+        self.CONF["spreadsheet_headers"] = self.spreadsheet_headers
+        self._schedule_save_conf()
+        self._show_info(f"'{title_text}' header saved.")
+        popup.dismiss()
 
-        popup.open()
+    def _on_header_editor_reset(self, *_):
+        header_key, _title_text = self._header_editor_target
+        self._header_editor[2].text = DEFAULT_SPREADSHEET_HEADERS[header_key]
 
     def _open_prompt_editor(self, prompt_type: str):
         if prompt_type == "pass1":
             title = "Edit Pass 1 (Summarization) Prompt"
             initial_text = self.prompt_pass1
-            default_text = PROMPT_TEMPLATE_PASS1
         elif prompt_type == "pass2":
             title = "Edit Pass 2 (Formatting) Prompt"
             initial_text = self.prompt_pass2
-            default_text = PROMPT_TEMPLATE_PASS2
         else:
             return
 
+        # Built once and reused, like the header editor
+        if self._prompt_editor is None:
+            self._prompt_editor = self._build_prompt_editor()
+        popup, text_input = self._prompt_editor
+        self._prompt_editor_target = prompt_type
+        popup.title = title
+        text_input.text = initial_text
+        popup.open()
+
+    def _build_prompt_editor(self) -> tuple:
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
         
         # Configure TextInput for scrolling within a ScrollView
         text_input = TextInput(
-            text=initial_text,
             font_size=22,  # Increased font size for readability
             size_hint_y=None,  # Disable vertical size hint to allow custom height
         )
@@ -2239,33 +2997,32 @@ class PacificaAgendaApp(App):
         btn_layout.add_widget(save_btn)
         content.add_widget(btn_layout)
 
-        popup = Popup(title=title, content=content, size_hint=(0.9, 0.9), auto_dismiss=False)
-
-        def on_save(*_):
-            new_text = text_input.text
-            if prompt_type == "pass1":
-                self.prompt_pass1 = new_text
-                self.CONF["prompt_pass1"] = new_text
-            else: # pass2
-                self.prompt_pass2 = new_text
-                self.CONF["prompt_pass2"] = new_text
-            self._save_conf()
-            self._show_info("Prompt saved successfully.")
-            popup.dismiss()
+        popup = Popup(content=content, size_hint=(0.9, 0.9), auto_dismiss=False)
 
-        def on_reset(*_):
-            text_input.text = default_text
+        save_btn.fbind('on_release', self._on_prompt_editor_save)
+        reset_btn.fbind('on_release', self._on_prompt_editor_reset)
+        cancel_btn.fbind('on_release', popup.dismiss)
 
-        def on_cancel(*_):
-            popup.dismiss()
+        return popup, text_input
 
-        save_btn.bind(on_release=on_save)
-        reset_btn.bind(on_release=on_reset)
-        cancel_btn.bind(on_release=on_cancel)
+    def _on_prompt_editor_save(self, *_):
+        popup, text_input = self._prompt_editor
+        new_text = text_input.text
+        if self._prompt_editor_target == "pass1":
+            self.prompt_pass1 = new_text
+            self.CONF["prompt_pass1"] = new_text
+        else: # pass2
+            self.prompt_pass2 = new_text
+            self.CONF["prompt_pass2"] = new_text
+        self._schedule_save_conf()
+        self._show_info("Prompt saved successfully.")
+        popup.dismiss()
 
-        popup.open()
+    def _on_prompt_editor_reset(self, *_):
+        default_text = PROMPT_TEMPLATE_PASS1 if self._prompt_editor_target == "pass1" else PROMPT_TEMPLATE_PASS2
+        self._prompt_editor[1].text = default_text
 
-    def _confirm_uninstall(self):
+    def _confirm_uninstall(self, *_):
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
 
         label = Label(
@@ -2299,11 +3056,34 @@ class PacificaAgendaApp(App):
         popup.open()
 
     def _do_uninstall(self):
+        # Removing the data folder (model files included) can take a while,
+        # so it runs on a worker thread behind a progress popup
+        self._uninstall_popup = Popup(
+            title="Uninstalling",
+            content=Label(text="Removing application data...", halign='center'),
+            size_hint=(0.6, 0.3),
+            auto_dismiss=False,
+        )
+        self._uninstall_popup.open()
+        threading.Thread(target=self._uninstall_worker, args=(self.user_data_dir,), daemon=True).start()
+
+    def _uninstall_worker(self, data_dir: str):
         try:
-            data_dir = self.user_data_dir
             if os.path.exists(data_dir):
                 shutil.rmtree(data_dir)
+        except Exception as e:
+            self._on_uninstall_done(e)
+        else:
+            self._on_uninstall_done(None)
 
+    @mainthread
+    def _on_uninstall_done(self, error: Exception | None):
+        self._uninstall_popup.dismiss()
+        self.backend.invalidate_models_cache()
+        if error is not None:
+            self._show_error("Uninstall Error", f"Could not remove application data: {error}")
+            return
+        try:
             # Reset model keys in config
             self.CONF.pop("current_model", None)
             self.CONF.pop("model_path", None)  # legacy
@@ -2327,8 +3107,7 @@ class PacificaAgendaApp(App):
             final_msg_content = Label(text=msg, halign='center')
             popup = Popup(title="Uninstall Complete", content=final_msg_content, size_hint=(0.6, 0.4))
 
-            # Use a clock schedule to close the app after the popup is shown
-            from kivy.clock import Clock
+            # Close the app once the user dismisses the popup
             def close_app(*_):
                 self.stop()
 
@@ -2364,10 +3143,10 @@ class PacificaAgendaApp(App):
         # title with back button
         header = BoxLayout(orientation="horizontal", size_hint_y=None, height=85 * scale, spacing=10 * scale)
         back_btn = StyledButton(text="Back", size_hint=(None, None), width=180, height=75)
-        back_btn.bind(on_release=lambda *_: self._navigate_to("home"))
+        back_btn.fbind('on_release', self._navigate_to, "home")
         header.add_widget(back_btn)
         
-        title = Label(text="[b]Help & Instructions[/b]", markup=True, font_size=50 * scale, color=[0, 0, 0, 1])
+        title = Label(text="[b]Help & Instructions[/b]", markup=True, font_size=50 * scale, color=BLACK_RGBA)
         header.add_widget(title)
         header.add_widget(Widget(size_hint=(None, None), width=150 * scale))  # spacer to balance title
         root.add_widget(header)
@@ -2382,15 +3161,15 @@ class PacificaAgendaApp(App):
             text="", # Will be populated dynamically
             markup=True,
             font_size=26 * scale,
-            color=[0, 0, 0, 1],
+            color=BLACK_RGBA,
             text_size=(None, None),
             halign="left",
             valign="top",
             size_hint_y=None
         )
-        self.help_label.bind(width=lambda inst, width: inst.setter('text_size')(inst, (width - 40, None)))
-        self.help_label.bind(texture_size=lambda inst, size: setattr(inst, 'height', size[1]))
-        self.help_label.bind(on_ref_press=self._on_ref_press)
+        self.help_label.fbind('width', _sync_text_size_inset)
+        self.help_label.fbind('texture_size', _sync_height_to_texture)
+        self.help_label.fbind('on_ref_press', self._on_ref_press)
         content.add_widget(self.help_label)
         
         scroll.add_widget(content)
@@ -2402,58 +3181,19 @@ class PacificaAgendaApp(App):
         # This method is called right before the help screen is displayed.
         # It builds the help text with the current spreadsheet header configuration.
         scale = self.gui_scale_factor
-        help_text = (
-            f"[size={int(42 * scale)}][b]Welcome to the Agenda Summary Generator v5.0![/b][/size]\n\n"
-            "This guide will walk you through using the application, from initial setup to generating your first report.\n\n"
-            
-            f"[size={int(34 * scale)}][b]First-Time Setup & Model Installing[/b][/size]\n\n"
-            "Before you can generate reports, you need at least one AI model installed. Navigate to Settings and click the Model Settings button to access the Install Models screen.\n\n"
-            "You can add a model in two ways:\n\n"
-            "[b]Internet Install the Recommended Model (From Online)[/b]\n"
-            "This is the easiest way to get started. Click the large button at the bottom to download the recommended model (approx. 2.6 GB). The application will install it for you, which may take a few minutes.\n\n"
-            "[b]Install a Model from a File (Offline)[/b]\n"
-            "This option is for any GGUF-format model saved on your computer or a drive. In the large upload area, click to browse for a .gguf file or drag and drop the file directly onto the zone. The model file will be copied into the application's data folder and become available for use.\n\n"
-            "Once installed, your models will appear in the Available Models dropdown list. Select a model from the dropdown to use it for generation; it will load in the background. You can install multiple models and switch between them. Use the Refresh button to update the list if you've manually added files, and the Delete Model button to remove the currently selected model.\n\n"
-
-            f"[size={int(34 * scale)}][b]How to Generate a Report[/b][/size]\n\n"
-            "[b]Prepare Your Excel File[/b]\n"
-            "Your data must be in a Microsoft Excel (.xlsx) file. If your file has multiple sheets, the app will prompt you to select the one containing your agenda data.\n"
-            "The selected sheet needs specific column headers. By default, it looks for:\n"
-            f"  - \"[b]{self.spreadsheet_headers['date']}[/b]\" for the Meeting Date\n"
-            f"  - \"[b]{self.spreadsheet_headers['section']}[/b]\" for the Agenda Section\n"
-            f"  - \"[b]{self.spreadsheet_headers['item']}[/b]\" for the Agenda Item Title\n"
-            f"  - \"[b]{self.spreadsheet_headers['notes']}[/b]\" for any additional notes\n"
-            f"  - \"[b]{self.spreadsheet_headers['include']}[/b]\" to automatically select an item (cell value '[b]Y[/b]' or '[b]Yes[/b]' — case-insensitive)\n"
-            "For the app to identify agenda items correctly, the date column value must start with a number in [date]-[3-letter-month] format (e.g., 01-Jan or 31-Dec).\n\n"
-
-            "[b]Upload Your File[/b]\n"
-            "On the home screen, drag and drop your .xlsx file onto the large upload area or click the area to open a file browser. If your Excel file has multiple sheets, a popup will ask you to select which sheet to process.\n\n"
-
-            "[b]Review and Select Items[/b]\n"
-            "After uploading, a list of all agenda items found in your file will appear. Items are automatically checked if their Include column is Y or Yes (case-insensitive). Manually check or uncheck any item by clicking on it. Use the Select All and Deselect All buttons for quick changes. Toggle Ignore Bracketed Text in settings to filter out text in brackets.\n\n"
-            
-            "[b]Generate the Summary[/b]\n"
-            "Once satisfied with your selections, click the Generate button. You will see the AI generating the report in real-time on a new screen. Generation time depends on the selected model and your computer hardware. Processing may take longer on slower computers. The output window and debug console (if enabled) will scroll automatically.\n\n"
-
-            "[b]Save or Copy Your Report[/b]\n"
-            "When finished, the Save and Copy buttons will activate. A notification sound will play, and the app window will come to the front. Click Save to export the report as a formatted Microsoft Word (.docx) file, or Copy to place the entire report text on your clipboard. After saving, a confirmation dialog appears with OK and Open File Location buttons to reveal the saved file in your file manager.\n\n"
-
-            f"[size={int(34 * scale)}][b]Advanced Settings[/b][/size]\n\n"
-            "The Settings screen provides powerful customization options:\n"
-            "• Model Settings: This button takes you to the model installation and management screen, as described in Part 1.\n"
-            "• Spreadsheet Column Headers: If your Excel file uses different header names (e.g., 'Meeting_Date' instead of 'MEETING DATE'), you can change what the app looks for here. Click each button ('Date', 'Section', etc.) to edit the corresponding header name.\n"
-            "• Prompt Templates: Advanced users can edit the instructions (prompts) given to the AI. This allows for fine-tuning the summarization and formatting style.\n"
-            "• Debug Mode: Toggling this on will show a detailed debug console on the generation screen, which is useful for troubleshooting. It displays the exact text sent to the AI and performance metrics like generation speed. For developers.\n"
-            "• Ignore Bracketed Text: When enabled, the app will automatically remove any text found inside square brackets `[]` from your spreadsheet data before sending it to the AI.\n"
-            "• GUI Scale Factor: If UI elements appear too large or too small on your screen, you can adjust the scale. Enter a number (e.g., `1.0` for default, `1.2` for larger, `0.9` for smaller) and click 'Set Scale'. The UI will immediately rescale. A restart is not required.\n"
-            "• Uninstall App: This provides a quick way to completely remove all application data, including the downloaded model, settings, and logs. [b]Settings deletion is irreversible.[/b]\n\n"
-
-            f"[size={int(34 * scale)}][b]More Information (Video Guide!) & Source Code[/b][/size]\n\n"
-            "For the full documentation, source code, latest releases, and video guide, please visit the GitHub repository:\n"
-            "[ref=github_repo][u][color=4682B4]https://github.com/ningkaiyang/PacificaAutoAgendaWriter[/color][/u][/ref]"
-        )
-        if hasattr(self, 'help_label'):
-            self.help_label.text = help_text
+        # The text only depends on the scale and the headers, so reuse the
+        # last markup when neither has changed since the previous visit
+        key = (scale, tuple(self.spreadsheet_headers.items()))
+        if self._help_text_cache[0] == key:
+            self.help_label.text = self._help_text_cache[1]
+            return
+        help_text = HELP_TEXT_TEMPLATE.format_map({
+            **self.spreadsheet_headers,
+            "title_size": int(42 * scale),
+            "heading_size": int(34 * scale),
+        })
+        self._help_text_cache = (key, help_text)
+        self.help_label.text = help_text
 
     def _build_credits(self):
         scale = self.gui_scale_factor
@@ -2464,14 +3204,14 @@ class PacificaAgendaApp(App):
         # build header with back button and centered title
         header = BoxLayout(orientation="horizontal", size_hint_y=None, height=85 * scale, spacing=20 * scale)
         back_btn = StyledButton(text="Back", size_hint=(None, None), width=180, height=75)
-        back_btn.bind(on_release=lambda *_: self._navigate_to("home"))
+        back_btn.fbind('on_release', self._navigate_to, "home")
         header.add_widget(back_btn)
 
         title = Label(
             text="[b]About & Credits[/b]",
             markup=True,
             font_size=50 * scale,
-            color=[0, 0, 0, 1],
+            color=BLACK_RGBA,
             halign="center",
             valign="middle"
         )
@@ -2501,26 +3241,32 @@ class PacificaAgendaApp(App):
         scroll.add_widget(aligner_layout)
         root.add_widget(scroll)
 
+        # Spacer heights used between the credit blocks
+        gap_small = 5 * scale
+        gap_medium = 15 * scale
+        gap_large = 20 * scale
+
         # helper to add a centered label with wrapping
         def add_centered(text, fs, bold=False):
             fs = fs * scale
-            formatted_text = f"[b]{text}[/b]" if bold else text
+            # font_size already sets the size, so markup is only needed for
+            # bold text and the [ref] links
             lbl = Label(
-                text=f"[size={int(fs)}]{formatted_text}[/size]",
-                markup=True,
+                text=f"[b]{text}[/b]" if bold else text,
+                markup=bold or "[" in text,
                 font_size=fs,
-                color=[0, 0, 0, 1],
+                color=BLACK_RGBA,
                 size_hint_y=None,
                 halign="center",
                 valign="middle",
             )
             lbl.bind(
-                width=lambda inst, w: inst.setter("text_size")(inst, (w, None)),
-                texture_size=lambda inst, size: setattr(inst, "height", size[1]),
+                width=_sync_text_size,
+                texture_size=_sync_height_to_texture,
                 on_ref_press=self._on_ref_press,
             )
             content.add_widget(lbl)
-            content.add_widget(Widget(size_hint_y=None, height=5 * scale)) # reduced spacing
+            content.add_widget(Widget(size_hint_y=None, height=gap_small)) # reduced spacing
 
         # Add logo similar to home screen
         try:
@@ -2532,17 +3278,17 @@ class PacificaAgendaApp(App):
                 logo_container.add_widget(logo)
                 logo_container.add_widget(Widget(size_hint_x=1))  # spacer for centering
                 content.add_widget(logo_container)
-                content.add_widget(Widget(size_hint_y=None, height=20 * scale)) # spacing after logo
+                content.add_widget(Widget(size_hint_y=None, height=gap_large)) # spacing after logo
         except Exception:
             pass
 
         # app title
         add_centered("City of Pacifica\nAgenda Summary Generator", 46, bold=True)
-        content.add_widget(Widget(size_hint_y=None, height=15 * scale))
+        content.add_widget(Widget(size_hint_y=None, height=gap_medium))
         
         # version
         add_centered("Version 5.0 - Direct Excel Handling", 38, bold=True)
-        content.add_widget(Widget(size_hint_y=None, height=15 * scale))
+        content.add_widget(Widget(size_hint_y=None, height=gap_medium))
 
         # description
         add_centered(
@@ -2551,11 +3297,11 @@ class PacificaAgendaApp(App):
             "for executive review and public transparency.",
             28,
         )
-        content.add_widget(Widget(size_hint_y=None, height=20 * scale))
+        content.add_widget(Widget(size_hint_y=None, height=gap_large))
 
         # development team header
         add_centered("Development Team (Best Interns Ever !!! 2025)", 36, bold=True)
-        content.add_widget(Widget(size_hint_y=None, height=15 * scale))
+        content.add_widget(Widget(size_hint_y=None, height=gap_medium))
 
         # team details
         add_centered(
@@ -2563,7 +3309,7 @@ class PacificaAgendaApp(App):
             "Project Coordination: [ref=madeleine_linkedin][u][color=4682B4]Madeleine Hur[/color][/u][/ref]",
             30,
         )
-        content.add_widget(Widget(size_hint_y=None, height=20 * scale))
+        content.add_widget(Widget(size_hint_y=None, height=gap_large))
         
         add_centered(
             "Built with Python, Kivy, and HuggingFace Open-Source Local LLMs.\n"
@@ -2584,13 +3330,13 @@ class PacificaAgendaApp(App):
         # Header bar
         top_bar = BoxLayout(orientation="horizontal", size_hint_y=None, height=75*scale, spacing=10*scale)
         back_btn = StyledButton(text="Back", size_hint=(None,None), width=180, height=75)
-        back_btn.bind(on_release=lambda *_: self._navigate_to("settings"))
+        back_btn.fbind('on_release', self._navigate_to, "settings")
         top_bar.add_widget(back_btn)
 
         title = Label(text="[b]Install Models[/b]", markup=True,
-                      font_size=50*scale, color=[0,0,0,1],
+                      font_size=50*scale, color=BLACK_RGBA,
                       halign="center", valign="middle")
-        title.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        title.bind(size=_sync_text_size)
         top_bar.add_widget(title)
 
         # Add a spacer of the same width as the back button to center the title
@@ -2617,7 +3363,7 @@ class PacificaAgendaApp(App):
 
         # Available models dropdown + refresh + delete
         list_bar = BoxLayout(orientation='horizontal', size_hint_y=None, height=75*scale, spacing=20*scale)
-        list_bar.add_widget(Label(text="Available Models:", color=[0,0,0,1], size_hint_x=None, width=220*scale, font_size=28*scale))
+        list_bar.add_widget(Label(text="Available Models:", color=BLACK_RGBA, size_hint_x=None, width=220*scale, font_size=28*scale))
         self.model_spinner = Spinner(text="Select Model",
                                      values=self.backend.get_available_models(),
                                      size_hint=(None,None), width=600*scale, height=75*scale,
@@ -2636,8 +3382,7 @@ class PacificaAgendaApp(App):
         root.add_widget(list_bar)
 
         # Initial refresh to set proper selection
-        from kivy.clock import Clock
-        Clock.schedule_once(lambda dt: self._refresh_models_dropdown(), 0)
+        Clock.schedule_once(self._refresh_models_dropdown, 0)
 
         self.screen_manager.add_widget(scr)
 
@@ -2655,6 +3400,7 @@ class PacificaAgendaApp(App):
             base_name = os.path.basename(file_path)
             dest_path = os.path.join(models_dir, base_name)
             shutil.copy(file_path, dest_path)
+            self.backend.invalidate_models_cache()
 
             # Update config & backend
             self.CONF["current_model"] = base_name
@@ -2670,29 +3416,38 @@ class PacificaAgendaApp(App):
             self._show_error("Install Error", f"Could not install model: {exc}")
 
     # ---------------------------------------------------------------- Generation logic
-    def _open_model_install_menu(self):
+    def _open_model_install_menu(self, *_):
+        self._ensure_screen("model_install")
         self.screen_manager.transition.direction = "left"
         self.screen_manager.current = "model_install"
 
     def _start_generation(self):
-        if not self.selected_indices:
+        if not self._selected_count:
             self._show_error("Nothing Selected", "Please select at least one row.")
             return
-        rows = [self.filtered_items[i] for i in sorted(self.selected_indices)]
+        # Only the selected rows are handed over, as plain dicts: to_dict builds
+        # them in one pass instead of a Series per row like iterrows()
+        rows = self.filtered_df[self.selection_mask].to_dict("records")
 
         # Reset auto-scroll state for the new generation
         self.auto_scroll_gen = True
         self.auto_scroll_debug = True
 
-        from kivy.clock import Clock
+        # Drop anything still queued from a previous (cancelled) run
+        with self._stream_lock:
+            self._pending_gen_text = []
+            self._pending_debug_text = []
 
         # Clear and prepare main output for generation
-        self.gen_output.text = "Generating...\n"
+        self._gen_text = "Generating...\n"
+        self.gen_output.text = self._gen_text
 
         # Clear and prepare debug console, then schedule scroll to bottom
         if self.debug_console and self.sv_debug:
+            self._debug_lines.clear()
+            self._debug_lines.append("")
             self.debug_console.text = ""
-            Clock.schedule_once(lambda dt: setattr(self.sv_debug, 'scroll_y', 0), -1)
+            self._reset_debug_scroll()
 
         self.save_button.disabled = True
         self.generation_cancel_event.clear()
@@ -2744,7 +3499,7 @@ class PacificaAgendaApp(App):
 
         msg = "This will cancel the current report generation. Are you sure?"
         lbl = Label(text=msg, halign='center', valign='middle')
-        lbl.bind(size=lambda inst, *_: inst.setter('text_size')(inst, (inst.width, None)))
+        lbl.bind(size=_sync_text_size)
         content.add_widget(lbl)
 
         btn_box = BoxLayout(size_hint_y=None, height=75 * scale, spacing=10 * scale)
@@ -2762,7 +3517,7 @@ class PacificaAgendaApp(App):
             popup.dismiss()
             self._navigate_to("review")
 
-        no_btn.bind(on_release=lambda *_: popup.dismiss())
+        no_btn.fbind('on_release', popup.dismiss)
         yes_btn.bind(on_release=confirm_cancel)
         popup.open()
 
@@ -2770,25 +3525,53 @@ class PacificaAgendaApp(App):
     def _token_cb(self, txt: str):
         if self.generation_cancel_event.is_set():
             return
-        self._append_gen_text(txt)
+        with self._stream_lock:
+            self._pending_gen_text.append(txt)
+        self._gen_flush_trigger()
+
+    def _flush_gen_text(self, *_, drain_all=False):
+        """Append queued tokens to the output, smoothing out bursts.
+
+        A short backlog is shown straight away so the first tokens are not
+        delayed; a long one is released over GEN_SMOOTHING_FRAMES frames.
+        """
+        with self._stream_lock:
+            pending = self._pending_gen_text
+            if drain_all or len(pending) <= GEN_SMOOTHING_MIN_BACKLOG:
+                take = len(pending)
+            else:
+                take = -(-len(pending) // GEN_SMOOTHING_FRAMES)
+            chunks = pending[:take]
+            del pending[:take]
+            more = bool(pending)
+        if chunks:
+            self._append_gen_text("".join(chunks))
+        if more:
+            self._gen_flush_trigger()
 
-    @mainthread
     def _append_gen_text(self, txt: str):
         """Appends text to the main generation output with smart scrolling."""
+        # Called at most once per frame (see _flush_gen_text)
+        self._gen_text += txt
+        # insert_text only lays out the lines it touches, whereas assigning
+        # .text re-lays out the whole report. It ignores read-only inputs,
+        # hence the brief toggle; from_undo keeps it off the undo stack.
+        out = self.gen_output
+        out.readonly = False
+        out.do_cursor_movement('cursor_end', control=True)
+        out.insert_text(txt, from_undo=True)
+        out.readonly = True
+
         if not self.sv_gen_output:
-            self.gen_output.text += txt
             return
 
-        self.gen_output.text += txt
-
         if self.auto_scroll_gen:
-            def scroll_if_needed(dt):
-                # Only scroll if the content is taller than the view to prevent visual glitches.
-                if self.sv_gen_output and self.gen_output and self.sv_gen_output.height < self.gen_output.height:
-                    self.sv_gen_output.scroll_y = 0
-            
-            from kivy.clock import Clock
-            Clock.schedule_once(scroll_if_needed, -1)
+            self._gen_scroll_trigger()
+
+    def _scroll_gen_to_end(self, *_):
+        # Only scroll if the content is taller than the view to prevent visual glitches.
+        if self.sv_gen_output and self.gen_output and self.sv_gen_output.height < self.gen_output.height:
+            self.sv_gen_output.scroll_y = 0
 
     @mainthread
     def _done_cb(self, full_text: str, dates: List[str]):
@@ -2798,49 +3581,63 @@ class PacificaAgendaApp(App):
         self.meeting_dates_for_report = dates
         self.save_button.disabled = False
         self.copy_button.disabled = False
+        # Tokens still queued belong before the marker
+        self._flush_gen_text(drain_all=True)
         self._append_gen_text("\n--- DONE ---\n")
         if Window.focus:
             self._show_info("Generation Complete. You can now save the report.")
         else:
-            self._send_completion_notification()
+            # Let the DONE marker paint before raising the window and playing the sound
+            Clock.schedule_once(self._send_completion_notification, 0)
 
     def _err_cb(self, exc: Exception):
         self._show_error("Generation Error", str(exc))
         self.screen_manager.current = "review"
 
-    def _on_scroll_stop(self, scroll_view, touch=None):
-        """
-        Detects user scrolling to enable/disable auto-scroll.
-        This is bound to on_scroll_stop, which fires when scrolling ceases.
-        The `touch` argument may be None.
-        """
-        # A small threshold to reliably detect if scrolled away from bottom.
-        # scroll_y is 0 at bottom, 1 at top.
-        is_at_bottom = scroll_view.scroll_y <= 0.01
+    # Detect user scrolling to enable/disable auto-scroll. Each scroll view
+    # gets its own on_scroll_stop handler; `touch` may be None. A small
+    # threshold reliably detects being at the bottom (scroll_y is 0 there).
+    def _on_gen_scroll_stop(self, scroll_view, touch=None):
+        self.auto_scroll_gen = scroll_view.scroll_y <= 0.01
 
-        if scroll_view == self.sv_gen_output:
-            self.auto_scroll_gen = is_at_bottom
-        elif scroll_view == self.sv_debug:
-            self.auto_scroll_debug = is_at_bottom
+    def _on_debug_scroll_stop(self, scroll_view, touch=None):
+        self.auto_scroll_debug = scroll_view.scroll_y <= 0.01
 
-    @mainthread
     def _update_debug_console(self, text: str):
-        """Callback to append text to the debug console from a worker thread."""
-        if not (self.debug_console and self.sv_debug):
+        """Callback to queue text for the debug console from a worker thread."""
+        with self._stream_lock:
+            self._pending_debug_text.append(text)
+        self._debug_flush_trigger()
+
+    def _flush_debug_console(self, *_):
+        with self._stream_lock:
+            chunks, self._pending_debug_text = self._pending_debug_text, []
+        if not (chunks and self.debug_console and self.sv_debug):
             return
 
-        self.debug_console.text += text
+        # Continue the last (partial) line, then push any new ones
+        lines = "".join(chunks).split("\n")
+        self._debug_lines[-1] += lines[0]
+        self._debug_lines.extend(lines[1:])
+        # Debug can be switched off mid-generation; keep collecting lines but
+        # leave the hidden widget alone until it is shown again
+        if self.debug_container.parent is None:
+            return
+        self.debug_console.text = "\n".join(self._debug_lines)
 
         if self.auto_scroll_debug:
-            def scroll_if_needed(dt):
-                # Only scroll if the content is taller than the view to prevent visual glitches.
-                if self.sv_debug and self.debug_console and self.sv_debug.height < self.debug_console.height:
-                    self.sv_debug.scroll_y = 0
+            self._debug_scroll_trigger()
+
+    def _snap_debug_scroll(self, *_):
+        # Unconditional jump to the bottom, used when a new generation starts
+        self.sv_debug.scroll_y = 0
 
-            from kivy.clock import Clock
-            Clock.schedule_once(scroll_if_needed, -1)
+    def _scroll_debug_to_end(self, *_):
+        # Only scroll if the content is taller than the view to prevent visual glitches.
+        if self.sv_debug and self.debug_console and self.sv_debug.height < self.debug_console.height:
+            self.sv_debug.scroll_y = 0
 
-    def _send_completion_notification(self):
+    def _send_completion_notification(self, *_):
         """Send a system notification when generation is done and app is not focused."""
         # 1. Raise window to grab attention (flashing icon). This is now safe
         # because this method is called from _done_cb, which is on the main thread.
@@ -2850,40 +3647,37 @@ class PacificaAgendaApp(App):
         except Exception:
             pass  # Silently fail if OS blocks this
 
-        # 2. Play a sound if available
-        try:
-            # NOTE: Requires 'notification.wav' or 'notification.mp3' in the root directory.
-            sound = SoundLoader.load('notification.wav')
-            if not sound:
-                sound = SoundLoader.load('notification.mp3')  # Fallback to mp3
-            
-            if sound:
-                sound.play()
-        except Exception as e:
-            print(f"Could not play notification sound: {e}", file=sys.stderr)
-
-        # 3. Send a system notification if plyer and its dependencies are installed
-        if notification:
+        # 2. Play the preloaded sound if available
+        if self._done_sound:
             try:
-                # .ico for Windows, .png for macOS/Linux (plyer handles this)
-                icon_path = ""
-                if platform == "win" and os.path.exists("logo.ico"):
-                    icon_path = "logo.ico"
-                elif os.path.exists("logo.png"):
-                    icon_path = "logo.png"
-                
-
-                notification.notify(
-                    title="Generation Complete",
-                    message="The agenda summary report is ready to be saved.",
-                    app_name="Pacifica Agenda Generator",
-                    app_icon=icon_path,
-                    timeout=10,  # Display notification for 10 seconds
-                )
+                self._done_sound.play()
             except Exception as e:
-                # Catching errors here is important for issues that occur at runtime
-                # even if dependencies are installed (e.g., D-Bus issues on Linux).
-                print(f"Error sending plyer notification: {e}", file=sys.stderr)
+                print(f"Could not play notification sound: {e}", file=sys.stderr)
+
+        # 3. Send a system notification if plyer and its dependencies are installed.
+        # plyer calls can block (pyobjus on macOS, D-Bus on Linux), so they run
+        # on a daemon thread instead of the UI thread.
+        threading.Thread(
+            target=self._send_system_notification, args=(self._notification_icon,), daemon=True
+        ).start()
+
+    @staticmethod
+    def _send_system_notification(icon_path: str):
+        notifier = _get_notifier()
+        if not notifier:
+            return
+        try:
+            notifier.notify(
+                title="Generation Complete",
+                message="The agenda summary report is ready to be saved.",
+                app_name="Pacifica Agenda Generator",
+                app_icon=icon_path,
+                timeout=10,  # Display notification for 10 seconds
+            )
+        except Exception as e:
+            # Catching errors here is important for issues that occur at runtime
+            # even if dependencies are installed (e.g., D-Bus issues on Linux).
+            print(f"Error sending plyer notification: {e}", file=sys.stderr)
 
     def _copy_report_to_clipboard(self):
         from kivy.core.clipboard import Clipboard
@@ -2911,37 +3705,82 @@ class PacificaAgendaApp(App):
     def _save_docx(self, doc, suggested_name: str):
         # try native save dialog first
         filters = [("Word Documents", "*.docx"), ("All files", "*.*")]
-        save_path = native_save_file_dialog(
+        run_native_dialog(
+            native_save_file_dialog,
+            lambda save_path: self._on_native_save_path(doc, suggested_name, save_path),
             title="Save Report",
             filename=suggested_name,
             file_types=filters
         )
-        
-        if save_path is not None:
-            # Native dialog was used. If save_path is not empty, a file was chosen.
-            # If it's an empty string, user cancelled.
-            if save_path:
-                # ensure .docx extension
-                if not save_path.lower().endswith(".docx"):
-                    save_path += ".docx"
-                
-                try:
-                    doc.save(save_path)
-                    self._show_save_success_popup(save_path)
-                except Exception as exc:
-                    self._show_error("save error", str(exc))
-            return # Return here to prevent Kivy fallback
-        
-        # fallback to kivy file chooser with proper save functionality
+
+    def _on_native_save_path(self, doc, suggested_name: str, save_path):
+        if save_path is None:
+            # Native dialog not supported/failed
+            self._open_kivy_save_chooser(doc, suggested_name)
+            return
+
+        # Native dialog was used. If save_path is not empty, a file was chosen.
+        # If it's an empty string, user cancelled.
+        if save_path:
+            self._write_docx(doc, _ensure_docx(save_path))
+
+    def _write_docx(self, doc, save_path: str, chooser_popup: Popup | None = None):
+        """Save *doc* on a worker thread behind a 'Saving...' popup.
+
+        python-docx serialises and zips the whole document in doc.save(), which
+        would otherwise freeze the UI. *chooser_popup* is closed on success.
+        """
+        saving = Popup(
+            title="Saving",
+            content=Label(text="Saving report..."),
+            size_hint=(0.5, 0.3),
+            auto_dismiss=False,
+        )
+        saving.open()
+
+        def worker():
+            try:
+                doc.save(save_path)
+            except Exception as exc:
+                self._on_docx_saved(saving, chooser_popup, save_path, exc)
+            else:
+                self._on_docx_saved(saving, chooser_popup, save_path, None)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    @mainthread
+    def _on_docx_saved(self, saving: Popup, chooser_popup: Popup | None, save_path: str, error: Exception | None):
+        saving.dismiss()
+        if error is not None:
+            self._show_error("save error", str(error))
+            return
+        if chooser_popup is not None:
+            chooser_popup.dismiss()
+        self._show_save_success_popup(save_path)
+
+    def _open_kivy_save_chooser(self, doc, suggested_name: str):
+        # fallback to kivy file chooser with proper save functionality.
+        # The popup is built once; later saves only swap the document and
+        # reset the folder and filename.
+        popup = self._save_chooser_popup
+        if popup is None:
+            popup = self._build_save_chooser()
+            self._save_chooser_popup = popup
+        self._save_chooser_target = (doc, suggested_name)
+        self._save_chooser_fc.path = os.getcwd()
+        self._save_chooser_fc.selection = []
+        self._save_chooser_name.text = suggested_name
+        popup.open()
+
+    def _build_save_chooser(self) -> Popup:
         content = BoxLayout(orientation='vertical', spacing=10, padding=10)
         
         # file chooser
-        fc = FileChooserListView(path=os.getcwd(), filters=["*.docx"])
+        fc = FileChooserListView(filters=["*.docx"])
         content.add_widget(fc)
         
         # filename input
         filename_input = TextInput(
-            text=suggested_name,
             size_hint_y=None,
             height=40,
             multiline=False,
@@ -2959,53 +3798,44 @@ class PacificaAgendaApp(App):
         
         popup = Popup(title="Save Report", content=content, size_hint=(0.9, 0.9))
         
-        def _on_save(*args):
-            # get filename from input
-            filename = filename_input.text.strip()
-            if not filename:
-                filename = suggested_name
-            
-            # ensure .docx extension
-            if not filename.lower().endswith(".docx"):
-                filename += ".docx"
-            
-            # construct full path
-            save_path = os.path.join(fc.path, filename)
-            
-            try:
-                doc.save(save_path)
-                popup.dismiss()
-                self._show_save_success_popup(save_path)
-            except Exception as exc:
-                self._show_error("save error", str(exc))
+        save_btn.fbind('on_release', self._on_save_chooser_save)
+        cancel_btn.fbind('on_release', popup.dismiss)
+        fc.fbind('selection', self._on_save_chooser_selection)
         
-        def _on_cancel(*args):
-            popup.dismiss()
-        
-        # update path when folder selection changes
-        def _on_selection(instance, selection):
-            if selection and os.path.isdir(selection[0]):
-                fc.path = selection[0]
+        self._save_chooser_fc = fc
+        self._save_chooser_name = filename_input
+        return popup
+
+    def _on_save_chooser_save(self, *_):
+        doc, suggested_name = self._save_chooser_target
+        # get filename from input
+        filename = self._save_chooser_name.text.strip()
+        if not filename:
+            filename = suggested_name
         
-        save_btn.bind(on_release=_on_save)
-        cancel_btn.bind(on_release=_on_cancel)
-        fc.bind(selection=_on_selection)
+        # construct full path
+        save_path = os.path.join(self._save_chooser_fc.path, _ensure_docx(filename))
         
-        popup.open()
+        self._write_docx(doc, save_path, chooser_popup=self._save_chooser_popup)
+
+    def _on_save_chooser_selection(self, fc, selection):
+        # update path when folder selection changes
+        if selection and os.path.isdir(selection[0]):
+            fc.path = selection[0]
 
     # ---------------------------------------------------------------- Alerts
     @mainthread
     def _show_error(self, title, msg, markup=False, *args):
         content = Label(text=msg, markup=markup, halign="center")
         popup = Popup(title=title, content=content, size_hint=(0.8, 0.5))
-        content.bind(width=lambda *x: content.setter('text_size')(content, (content.width, None)))
+        content.bind(width=_sync_text_size)
         popup.open()
 
     @mainthread
     def _show_info(self, msg, *args):
         content = Label(text=msg, halign="center")
         popup = Popup(title="Info", content=content, size_hint=(0.6, 0.4))
-        content.bind(width=lambda *x: content.setter('text_size')(content, (content.width, None)))
+        content.bind(width=_sync_text_size)
         popup.open()
 
     @mainthread
@@ -3014,7 +3844,7 @@ class PacificaAgendaApp(App):
         content = BoxLayout(orientation='vertical', spacing=10 * scale, padding=10 * scale)
 
         lbl = Label(text=f"Report saved successfully to:\n{path}", halign='center', valign='middle')
-        lbl.bind(width=lambda inst, w: inst.setter('text_size')(inst, (w, None)))
+        lbl.bind(width=_sync_text_size)
         content.add_widget(lbl)
 
         btn_box = BoxLayout(size_hint_y=None, height=75 * scale, spacing=10 * scale)
@@ -3040,7 +3870,7 @@ class PacificaAgendaApp(App):
                 popup.dismiss()
 
         open_btn.bind(on_release=open_folder)
-        ok_btn.bind(on_release=lambda *_: popup.dismiss())
+        ok_btn.fbind('on_release', popup.dismiss)
         popup.open()
 
 